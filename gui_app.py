@@ -12,17 +12,45 @@ try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
 except ImportError:
     TkinterDnD = None
+
+try:
+    from PIL import Image, ImageTk
+except ImportError:
+    Image = ImageTk = None
+
+try:
+    import pyvips  # Optional: much faster shrink-on-load for preview thumbnails
+except (ImportError, OSError):  # OSError when the libvips library itself is missing
+    pyvips = None
+
+try:
+    import orjson  # Optional: faster decoding of Grok responses
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd  # Optional: faster parsing of very large order CSVs
+except ImportError:
+    pd = None
 import os
 import sys
 import csv
+import functools
+import heapq
+import io
 import tempfile
 import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import shelve
 import shutil
 import subprocess
 import platform
+import queue
 import time
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import Path
 
@@ -32,45 +60,392 @@ import process_orders
 # Grok API configuration
 GROK_API_URL = "https://api.x.ai/v1/chat/completions"
 
+# Decoded preview thumbnails persist here between sessions
+THUMB_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'fhm-app', 'thumbs')
+
+# Preview window builds this many order rows up front, then the rest in batches of the same size
+PREVIEW_ROW_BATCH = 10
+
+# Search results above this size are loaded into the listbox a page at a time
+SEARCH_LIST_LAZY_THRESHOLD = 500
+SEARCH_LIST_PAGE = 200
+
+# Thumbnail PhotoImages kept per preview window (shared by rows with the same image)
+PREVIEW_PHOTO_CACHE_SIZE = 128
+
+# Preview thumbnails are decoded for rows within this many pixels of the visible area
+PREVIEW_THUMB_MARGIN = 200
+
+# Master PDF merges are written to disk every this many PDFs to bound memory
+MERGE_BATCH_SIZE = 20
+
+# Order CSVs at least this big are parsed with pandas when it is installed
+CSV_PANDAS_MIN_BYTES = 1024 * 1024
+
+# Resolve the platform opener once; os.startfile is used on Windows
+_SYSTEM = platform.system()
+if _SYSTEM == 'Darwin':  # macOS
+    _OPEN_COMMAND = ['open']
+elif _SYSTEM == 'Windows':
+    _OPEN_COMMAND = None
+else:  # Linux
+    _OPEN_COMMAND = ['xdg-open']
+
 def open_file_or_folder(path):
     """Cross-platform way to open files or folders"""
     try:
-        system = platform.system()
-        if system == 'Darwin':  # macOS
-            subprocess.run(['open', path], check=True)
-        elif system == 'Windows':
+        if _OPEN_COMMAND is None:
             os.startfile(path)
-        else:  # Linux
-            subprocess.run(['xdg-open', path], check=True)
+        else:
+            subprocess.run(_OPEN_COMMAND + [path], check=True)
     except Exception as e:
         raise Exception(f"Failed to open {path}: {e}")
 
+# Try parent directory first (canva folder), then fall back to local config
+GROK_CONFIG_DIR = os.path.dirname(os.path.abspath(os.getcwd()))
+GROK_CONFIG_PATHS = (os.path.join(GROK_CONFIG_DIR, 'grok_config.txt'), "grok_config.txt")
+
+# Config file the current key was read from, so a reload only re-reads a changed file
+_GROK_KEY_SOURCE = {'path': None, 'mtime_ns': None, 'key': None}
+
 def load_api_key():
     """Load API key from config file"""
-    try:
-        # Try parent directory first (canva folder)
-        parent_dir = os.path.dirname(os.path.abspath(os.getcwd()))
-        parent_config = os.path.join(parent_dir, 'grok_config.txt')
-        if os.path.exists(parent_config):
-            with open(parent_config, 'r') as f:
-                key = f.read().strip()
-                if key:
-                    return key
-        
-        # Fallback: check local config
-        if os.path.exists("grok_config.txt"):
-            with open("grok_config.txt", 'r') as f:
+    for config_path in GROK_CONFIG_PATHS:
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+            if config_path == _GROK_KEY_SOURCE['path'] and mtime_ns == _GROK_KEY_SOURCE['mtime_ns']:
+                return _GROK_KEY_SOURCE['key']
+            with open(config_path, 'r') as f:
                 key = f.read().strip()
-                if key:
-                    return key
-    except Exception as e:
-        print(f"Warning: Could not load API key: {e}")
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            print(f"Warning: Could not load API key: {e}")
+            continue
+        if key:
+            _GROK_KEY_SOURCE.update(path=config_path, mtime_ns=mtime_ns, key=key)
+            return key
+    _GROK_KEY_SOURCE.update(path=None, mtime_ns=None, key=None)
     return None
 
 GROK_API_KEY = load_api_key()
 
+# orjson's decode errors subclass json.JSONDecodeError, so existing handlers still apply
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Request pieces shared by every Grok call (each call adds its model and messages)
+GROK_HEADERS = {
+    "Authorization": f"Bearer {GROK_API_KEY}",
+    "Content-Type": "application/json"
+}
+
+def reload_grok_key():
+    """Pick up a key added or changed since startup (just a stat when nothing changed)"""
+    global GROK_API_KEY
+    GROK_API_KEY = load_api_key()
+    GROK_HEADERS["Authorization"] = f"Bearer {GROK_API_KEY}"
+    return GROK_API_KEY
+
+GROK_BASE_DATA = {
+    "temperature": 0.1
+}
+
+# Output budget per request: scales with the items in the text, never below the old fixed 2000
+# (reasoning models spend part of it before answering, so small orders keep the full floor)
+GROK_MIN_TOKENS = 2000
+GROK_MAX_TOKENS = 16000
+GROK_TOKENS_PER_ITEM = 40
+
+def grok_token_budget(text):
+    """max_tokens for a request whose answer has roughly one entry per line/comma of text"""
+    est_items = text.count('\n') + text.count(',') + 1
+    return min(GROK_MAX_TOKENS, max(GROK_MIN_TOKENS, 512 + est_items * GROK_TOKENS_PER_ITEM))
+
+# One keep-alive session for all Grok calls; retries rate limits and transient server errors
+GROK_SESSION = requests.Session()
+GROK_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=frozenset(["POST"]))
+))
+
+# STAGE 1 prompt: raw order text -> "Character description - name: PersonName" lines
+STAGE1_PROMPT = """You are extracting character and name pairs from Disney magnet order text.
+
+Your job is to format raw order data into a simple, clean list.
+
+IMPORTANT RULES:
+1. Extract ONLY character-name pairs (one per line)
+2. Format EXACTLY as: "Character description - name: PersonName"
+3. For boat orders, extract the boat with its ship name. Format as: "boat ShipName - name: FamilyName"
+4. If a line has BOTH a boat AND regular character orders, extract BOTH the boat AND the regular characters
+5. A single order line can have 1-5 character-name pairs (plus possibly a boat)
+6. Keep character descriptions simple and natural (e.g., "Luke Skywalker", "Stitch captain", "Minnie Spiderman")
+7. Preserve exact name spellings from the order
+8. If no name is specified for a character, use "no name" for the name
+9. Duck and dog orders do not need captain, pirate, etc. Just duck/dog and the ID number with them.
+10. Do not omit any items from the order including boats.
+11. The header for an order determines the theme. For example, if the header is pirate, every item in that order is pirate. Same with captain, christmas, etc. If the order is boat, assume captain theme for the character magnets.
+
+=== BOAT ORDER DETECTION ===
+If the order mentions ANY of these, it includes a BOAT order:
+- "boat" or "ship"
+- Disney cruise ship names: Fantasy, Magic, Wonder, Wish, Dream, Treasure, Destiny
+- "cruise ship door decoration" or similar
+
+BOAT SHIP NAME MAPPING:
+- Disney Fantasy → boat Fantasy
+- Disney Magic → boat Magic
+- Disney Wonder → boat Wonder
+- Disney Wish → boat Wish
+- Disney Dream → boat Dream
+- Disney Treasure → boat Treasure
+- Disney Destiny → boat Destiny
+
+EXAMPLES:
+
+Input: "Item: Captain Mickey, Personalization: Johnny"
+Output: Mickey captain - name: Johnny
+
+Input: "Item: Christmas Elsa\\nPersonalization: Sarah"
+Output: Elsa christmas - name: Sarah
+
+Input: "captain Order has boat +  Minnie for 'Katie' and  Woody for 'Sean' and dog 16 for 'Joni'"
+Output: 
+boat Fantasy - name: Katie
+Minnie captain - name: Katie
+Woody captain - name: Sean
+dog 16 - name: Joni
+
+Input: "Disney Fantasy boat for The Smith Family"
+Output:
+boat Fantasy - name: The Smith Family
+
+Input: "Disney Magic ship for Johnson Crew, also Mickey captain for Johnny"
+Output:
+boat Magic - name: Johnson Crew
+Mickey captain - name: Johnny
+
+Input: "1. Dory Captain - Joni  2. Ariel pirate - Gracie  3. Rapunzel Captain - Lila"
+Output:
+Dory captain - name: Joni
+Ariel pirate - name: Gracie
+Rapunzel captain - name: Lila
+
+Now process this order text:
+{raw_text}
+
+OUTPUT FORMAT: Return ONLY the formatted lines, one per line, no explanations, no markdown, just the text:"""
+
+# STAGE 2 prompt: formatted lines -> exact image filenames (literal braces are doubled for str.format)
+STAGE2_PROMPT = """You are matching Disney character descriptions to exact image filenames.
+
+You will receive pre-formatted order text in this format:
+"Character description - name: PersonName"
+
+Your job is to match each character description to an EXACT image filename from the available list.
+
+COMPLETE LIST OF AVAILABLE IMAGES ({count} total):
+{images}
+
+Pre-formatted order text:
+{order_text}
+
+MATCHING RULES:
+1. For each line, extract the character description and the name
+2. Match the character description to an EXACT filename from the list above
+3. You MUST use filenames EXACTLY as shown (including .png extension)
+4. **CRITICAL: If you cannot find a match, use "N/A.png" - DO NOT skip the item!**
+4.5 if there is a request for a captain, but there is only a normal image, use the normal image.
+5. Common patterns to match:
+   - "Mickey captain" → "mickey-captain.png"
+   - "Stitch captain" → "stitch-captain.png"
+   - "Elsa christmas" → "elsa-christmas.png"
+   - "Minnie Spiderman" → "minnie-spiderman.png"
+   - "Minnie pirate" → "minnie-pirate.png"
+   - "Donald Hulk" → "donald-hulk.png"
+   - "dog 16" → "dog-16.png"
+   - "duck 23" → "duck-23.png"
+6. Character names are case-insensitive for matching
+7. ALWAYS include ALL items, even if no match found (use "N/A.png")
+8. for magnets with no name, leave it blank. (example "name": "")
+
+=== BOAT IMAGE MATCHING ===
+Boat orders appear as "boat ShipName - name: FamilyName"
+Match boat orders to these EXACT filenames:
+- "boat Fantasy" → "boat_fantasy.png"
+- "boat Magic" → "boat_magic.png"
+- "boat Wonder" → "boat_wonder.png"
+- "boat Wish" → "boat_wish.png"
+- "boat Dream" → "boat_dream.png"
+- "boat Treasure" → "boat_treasure.png"
+- "boat Destiny" → "boat_destiny.png"
+- If ship name is unclear, default to "boat_fantasy.png"
+
+OUTPUT FORMAT - Return ONLY a Python LIST of dictionaries, no other text:
+[
+  {{"name": "PersonName1", "image": "exact-filename.png", "item": "original character description"}},
+  {{"name": "PersonName2", "image": "exact-filename.png", "item": "original character description"}},
+  {{"name": "", "image": "N/A.png", "item": "original character description"}}
+]
+
+EXAMPLES:
+
+Input: "Mickey captain - name: Johnny"
+Output: [{{"name": "Johnny", "image": "mickey-captain.png", "item": "Mickey captain"}}]
+
+Input: "Stitch pirate - name: Michael\\nMinnie Spiderman - name: Cecile"
+Output: [
+  {{"name": "Michael", "image": "stitch-pirate.png", "item": "Stitch pirate"}},
+  {{"name": "Cecile", "image": "minnie-spiderman.png", "item": "Minnie Spiderman"}}
+]
+
+Input: "boat Fantasy - name: The Smith Family"
+Output: [{{"name": "The Smith Family", "image": "boat_fantasy.png", "item": "boat Fantasy"}}]
+
+Input: "Mickey captain - name: Johnny\\nboat Magic - name: Johnson Crew\\nMinnie captain - name: Sarah"
+Output: [
+  {{"name": "Johnny", "image": "mickey-captain.png", "item": "Mickey captain"}},
+  {{"name": "Johnson Crew", "image": "boat_magic.png", "item": "boat Magic"}},
+  {{"name": "Sarah", "image": "minnie-captain.png", "item": "Minnie captain"}}
+]
+
+Input: "RareCharacter - name: Test"
+Output: [{{"name": "Test", "image": "N/A.png", "item": "RareCharacter"}}]
+
+CRITICAL: 
+- Only use filenames that EXACTLY match the list above
+- If no match found, use "N/A.png" - DO NOT OMIT THE ITEM
+- Return a LIST, preserving order
+- Include ALL items from the input
+- Boat orders use boat_*.png files, magnet orders use character-*.png files
+
+Return the list now:"""
+
+# Image folder listings, keyed by folder path -> (st_mtime_ns, sorted .png filenames, set of names)
+_IMG_CACHE = {}
+
+def _scan_images(images_dir):
+    """List .png files in a folder, reusing the last scan until the folder's mtime changes"""
+    mtime = os.stat(images_dir).st_mtime_ns
+    cached = _IMG_CACHE.get(images_dir)
+    if cached and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    with os.scandir(images_dir) as entries:
+        files = sorted(e.name for e in entries if e.name.lower().endswith('.png') and e.is_file())
+    names = {f[:-4] for f in files}
+    _IMG_CACHE[images_dir] = (mtime, files, names)
+    return files, names
+
+# pyvips band count -> PIL mode
+_VIPS_MODES = {1: 'L', 2: 'LA', 3: 'RGB', 4: 'RGBA'}
+
+def _make_thumbnail(path, size=(100, 100)):
+    """Decode an image straight down to thumbnail size (pyvips if installed, else Pillow)"""
+    if pyvips is not None:
+        try:
+            vimg = pyvips.Image.thumbnail(path, size[0], height=size[1])
+            mode = _VIPS_MODES.get(vimg.bands)
+            if mode and vimg.format == 'uchar':
+                return Image.frombuffer(mode, (vimg.width, vimg.height), vimg.write_to_memory(), 'raw', mode, 0, 1)
+        except pyvips.Error as e:
+            print(f"Warning: pyvips thumbnail failed for {path}: {e}")
+
+    with Image.open(path) as img:
+        # draft() + reducing_gap let the decoder/reduce() do most of the shrinking before LANCZOS
+        img.draft('RGB', size)
+        img.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+        img.load()
+    return img
+
+def _thumb_cache_key(path):
+    """Thumbnail cache key: absolute path plus mtime and size, so an edited image gets a new entry"""
+    st = os.stat(path)
+    return f"{os.path.abspath(path)}:{st.st_mtime_ns}:{st.st_size}"
+
+def _thumb_key_is_current(key):
+    """True while the image a thumbnail cache key was made from still exists unchanged"""
+    try:
+        return _thumb_cache_key(key.rsplit(':', 2)[0]) == key
+    except OSError:
+        return False
+
+@functools.lru_cache(maxsize=1)
+def _format_image_list(image_list):
+    """Bulleted image list for the Grok prompt (reused until the list changes)"""
+    return '\n'.join(f"  - {img}" for img in image_list)
+
+def _scan_json_chunk(state, text):
+    """Feed streamed text to a bracket scanner; returns the offset just past the first top-level JSON value once it closes, else 0"""
+    for i, ch in enumerate(text):
+        if state['in_str']:
+            if state['escape']:
+                state['escape'] = False
+            elif ch == '\\':
+                state['escape'] = True
+            elif ch == '"':
+                state['in_str'] = False
+        elif ch == '"':
+            if state['depth']:
+                state['in_str'] = True
+        elif ch in '[{':
+            state['depth'] += 1
+        elif ch in ']}' and state['depth']:
+            state['depth'] -= 1
+            if not state['depth']:
+                return i + 1
+    return 0
+
+def _extract_json_value(text, opener):
+    """First balanced JSON list/object in text starting at opener ('[' or '{'), or None"""
+    start = text.find(opener)
+    if start == -1:
+        return None
+    end = _scan_json_chunk({'depth': 0, 'in_str': False, 'escape': False}, text[start:])
+    return text[start:start + end] if end else None
+
+def _parse_order_lines(text):
+    """Split 'character,name[,year]' lines into (character, name, year) tuples plus a list of malformed lines"""
+    orders, malformed = [], []
+    for line in text.split('\n'):
+        if ',' not in line:
+            continue  # Lines without a comma aren't orders
+        # One line at a time, so an unbalanced quote can't swallow the orders after it
+        try:
+            row = next(csv.reader([line], strict=True))
+        except csv.Error:
+            row = []
+        if len(row) < 2:
+            malformed.append(line.strip())
+            continue
+        orders.append((row[0].strip(), row[1].strip(), row[2].strip() if len(row) > 2 else ""))  # Keep empty string for no personalization
+    return orders, malformed
+
+def _format_order_line(character, name, year=""):
+    """Inverse of _parse_order_lines for one order, quoting names that contain commas or quotes"""
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator='').writerow([character, name, year] if year else [character, name])
+    return buf.getvalue()
+
+def _order_count_text(orders, malformed):
+    """Order count label, flagging lines that couldn't be parsed"""
+    text = f"{len(orders)} orders"
+    if malformed:
+        text += f" ({len(malformed)} malformed)"
+    return text
+
 
 class OrderProcessorGUI:
+    # Placeholder text shown in the input boxes until the user types
+    ORDER_PLACEHOLDER = "mickey-captain,Johnny\nminnie-captain,Sarah\nstitch-captain,Michael\nmoana-captain,Emma"
+    RAW_PLACEHOLDER = """Paste order details here, like:
+
+Order #12345 - Mickey Captain themed, names: Johnny, Sarah, Michael
+or
+Disney Cruise Door Magnet - 3 magnets: Minnie, Donald, Goofy (all captain theme)"""
+
     def __init__(self, root):
         self.root = root
         self.root.title("Disney Magnet Order Processor 🤖 AI-Powered")
@@ -95,13 +470,62 @@ class OrderProcessorGUI:
         self.ai_processing = False
         self.master_pdf_path = None
         self.zoom_level = 1.0  # Default zoom level
+        self._count_after_id = None  # Pending debounced order count
+        self._order_input_is_placeholder = True  # Order input is showing the grey example text
+        self._log_queue = queue.Queue()  # Log lines from worker threads, flushed by pump_log_queue
+        
+        # Thumbnail cache shared by every preview window
+        self._thumb_db = self.open_thumbnail_cache()
         
         # Get available images
-        self.image_list = self.get_available_images()
-        self.available_images.set(f"{len(self.image_list)} character images available")
+        self.refresh_image_list()
         
         self.setup_ui()
+        self.pump_log_queue()
+        
+    def open_thumbnail_cache(self):
+        """Open the on-disk thumbnail cache (None if it can't be opened) and start pruning it in the background"""
+        try:
+            os.makedirs(os.path.dirname(THUMB_CACHE_PATH), exist_ok=True)
+            db = shelve.open(THUMB_CACHE_PATH)
+        except Exception as e:
+            print(f"Warning: Thumbnail cache unavailable: {e}")
+            return None
         
+        # Checking every entry's image can be slow on network folders, so do it off the UI thread
+        thread = threading.Thread(target=self.find_stale_thumbnails, args=(list(db.keys()),))
+        thread.daemon = True
+        thread.start()
+        return db
+
+    def find_stale_thumbnails(self, keys):
+        """Find cache entries whose image was edited or deleted (background thread), then prune on the UI thread"""
+        stale = [key for key in keys if not _thumb_key_is_current(key)]
+        if stale:
+            self.root.after(0, self.prune_thumbnail_cache, stale, len(keys))
+
+    def prune_thumbnail_cache(self, stale, total):
+        """Drop stale thumbnail cache entries so the file doesn't grow forever (UI thread owns the shelf)"""
+        if self._thumb_db is None:
+            return
+        try:
+            if len(stale) * 2 > total:
+                # Mostly stale: start a fresh file, since some dbm backends never reclaim deleted space
+                self._thumb_db.close()
+                self._thumb_db = None
+                self._thumb_db = shelve.open(THUMB_CACHE_PATH, flag='n')
+            else:
+                for key in stale:
+                    self._thumb_db.pop(key, None)
+        except Exception as e:
+            print(f"Warning: Could not prune thumbnail cache: {e}")
+
+    def close_thumbnail_cache(self):
+        """Flush and close the thumbnail cache"""
+        if self._thumb_db is not None:
+            self._thumb_db.close()
+            self._thumb_db = None
+
     def setup_ui(self):
         """Setup the user interface"""
         
@@ -248,12 +672,7 @@ class OrderProcessorGUI:
         self.raw_text.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
         
         # Placeholder
-        placeholder = """Paste order details here, like:
-
-Order #12345 - Mickey Captain themed, names: Johnny, Sarah, Michael
-or
-Disney Cruise Door Magnet - 3 magnets: Minnie, Donald, Goofy (all captain theme)"""
-        self.raw_text.insert(1.0, placeholder)
+        self.raw_text.insert(1.0, self.RAW_PLACEHOLDER)
         self.raw_text.config(fg="#999")
         
         self.raw_text.bind("<FocusIn>", self.clear_raw_placeholder)
@@ -359,14 +778,13 @@ Disney Cruise Door Magnet - 3 magnets: Minnie, Donald, Goofy (all captain theme)
         self.order_input.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
         
         # Placeholder text
-        placeholder = "mickey-captain,Johnny\nminnie-captain,Sarah\nstitch-captain,Michael\nmoana-captain,Emma"
-        self.order_input.insert(1.0, placeholder)
-        self.order_input.config(fg="#999")
+        self.order_input.insert(1.0, self.ORDER_PLACEHOLDER)
+        self.set_order_placeholder(True)
         
         # Bind events for placeholder
         self.order_input.bind("<FocusIn>", self.clear_placeholder)
         self.order_input.bind("<FocusOut>", self.restore_placeholder)
-        self.order_input.bind("<KeyRelease>", self.update_count)
+        self.order_input.bind("<KeyRelease>", self.schedule_update_count)
         
         # Button row
         btn_frame = tk.Frame(file_frame, bg=self.bg_color)
@@ -628,30 +1046,43 @@ Disney Cruise Door Magnet - 3 magnets: Minnie, Donald, Goofy (all captain theme)
         
     def clear_placeholder(self, event):
         """Clear placeholder text on focus"""
-        if self.order_input.get(1.0, tk.END).strip() in ["mickey-captain,Johnny\nminnie-captain,Sarah\nstitch-captain,Michael\nmoana-captain,Emma", ""]:
+        text = self.order_input.get(1.0, tk.END).strip()
+        if not text or text == self.ORDER_PLACEHOLDER:
             self.order_input.delete(1.0, tk.END)
-            self.order_input.config(fg="#333")
+            self.set_order_placeholder(False)
+            
+    def set_order_placeholder(self, is_placeholder):
+        """Track placeholder state and colour the order input to match"""
+        self._order_input_is_placeholder = is_placeholder
+        self.order_input.config(fg="#999" if is_placeholder else "#333")
             
     def restore_placeholder(self, event):
         """Restore placeholder if empty"""
         if not self.order_input.get(1.0, tk.END).strip():
-            placeholder = "mickey-captain,Johnny\nminnie-captain,Sarah\nstitch-captain,Michael\nmoana-captain,Emma"
-            self.order_input.insert(1.0, placeholder)
-            self.order_input.config(fg="#999")
+            self.order_input.insert(1.0, self.ORDER_PLACEHOLDER)
+            self.set_order_placeholder(True)
             
+    def schedule_update_count(self, event=None):
+        """Recount orders once typing pauses instead of on every keystroke"""
+        if self._count_after_id:
+            self.root.after_cancel(self._count_after_id)
+        self._count_after_id = self.root.after(120, self.update_count)
+
     def update_count(self, event=None):
         """Update order count as user types"""
+        if self._count_after_id:
+            self.root.after_cancel(self._count_after_id)
+            self._count_after_id = None
         text = self.order_input.get(1.0, tk.END).strip()
-        if text and self.order_input.cget("fg") == "#333":  # Not placeholder
-            lines = [l.strip() for l in text.split('\n') if l.strip() and ',' in l]
-            self.orders_count.set(f"{len(lines)} orders")
+        if text and not self._order_input_is_placeholder:
+            self.orders_count.set(_order_count_text(*_parse_order_lines(text)))
         else:
             self.orders_count.set("0 orders")
             
     def clear_input(self):
         """Clear the input area"""
         self.order_input.delete(1.0, tk.END)
-        self.order_input.config(fg="#333")
+        self.set_order_placeholder(False)
         self.preview_text.delete(1.0, tk.END)
         self.orders_count.set("0 orders")
         self.status_text.set("Ready to process orders")
@@ -666,7 +1097,7 @@ goofy-captain,Oliver
 pluto-captain,Sophia"""
         self.order_input.delete(1.0, tk.END)
         self.order_input.insert(1.0, sample)
-        self.order_input.config(fg="#333")
+        self.set_order_placeholder(False)
         self.update_count()
         self.status_text.set("Sample orders loaded")
         self.preview_orders()
@@ -682,75 +1113,85 @@ pluto-captain,Sophia"""
             
     def load_csv(self, filepath):
         """Load CSV file into input area"""
+        self.status_text.set(f"Loading {os.path.basename(filepath)}...")
+
+        # Parse in thread so large files don't freeze the UI
+        thread = threading.Thread(target=self.load_csv_thread, args=(filepath,))
+        thread.daemon = True
+        thread.start()
+
+    def load_csv_thread(self, filepath):
+        """Parse CSV file in background thread, then hand the text to the UI"""
         try:
-            # Read CSV
-            orders = []
-            with open(filepath, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                header = next(reader, None)
-                
-                for row in reader:
-                    if row and row[0].strip():
-                        character = row[0].strip()
-                        name = row[1].strip() if len(row) > 1 else ""
-                        orders.append(f"{character},{name}")
-            
-            # Load into input area
-            self.order_input.delete(1.0, tk.END)
-            self.order_input.insert(1.0, '\n'.join(orders))
-            self.order_input.config(fg="#333")
-            
-            self.update_count()
-            self.status_text.set(f"Loaded {len(orders)} orders from {os.path.basename(filepath)}")
-            self.preview_orders()
-            
+            orders = None
+            if pd is not None and os.path.getsize(filepath) >= CSV_PANDAS_MIN_BYTES:
+                try:
+                    # pandas' C parser is much faster on large exports
+                    df = pd.read_csv(filepath, header=0, usecols=[0, 1], dtype=str,
+                                     keep_default_na=False, encoding='utf-8', engine='c')
+                    characters = df.iloc[:, 0].str.strip()
+                    names = df.iloc[:, 1].str.strip()
+                    keep = characters != ''
+                    orders = [_format_order_line(c, n) for c, n in zip(characters[keep], names[keep])]
+                except ValueError:
+                    pass  # e.g. a single-column file; use the csv module below
+
+            if orders is None:
+                with open(filepath, 'r', newline='', encoding='utf-8') as f:
+                    reader = csv.reader(f)
+                    next(reader, None)  # Skip header
+                    orders = [
+                        _format_order_line(row[0].strip(), row[1].strip() if len(row) > 1 else '')
+                        for row in reader if row and row[0].strip()
+                    ]
+
+            self.root.after(0, self.apply_csv_orders, '\n'.join(orders), len(orders), filepath)
+
         except Exception as e:
             error_msg = str(e)
-            messagebox.showerror("Error", f"Failed to load CSV:\n{error_msg}")
-            self.log(f"ERROR: {error_msg}", "error")
-            
+            self.root.after(0, lambda msg=error_msg: messagebox.showerror("Error", f"Failed to load CSV:\n{msg}"))
+            self.root.after(0, lambda msg=error_msg: self.log(f"ERROR: {msg}", "error"))
+
+    def apply_csv_orders(self, orders_text, count, filepath):
+        """Load parsed CSV orders into input area (runs on the UI thread)"""
+        self.order_input.delete(1.0, tk.END)
+        self.order_input.insert(1.0, orders_text)
+        self.set_order_placeholder(False)
+
+        self.update_count()
+        self.status_text.set(f"Loaded {count} orders from {os.path.basename(filepath)}")
+        self.preview_orders()
+
     def preview_orders(self):
         """Preview the orders before processing"""
         text = self.order_input.get(1.0, tk.END).strip()
         
-        if not text or self.order_input.cget("fg") == "#999":
+        if not text or self._order_input_is_placeholder:
             self.preview_text.delete(1.0, tk.END)
             self.preview_text.insert(tk.END, "No orders to preview. Please add orders above.")
             return
         
         # Parse orders
-        orders = []
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if ',' in line:
-                parts = line.split(',', 1)
-                character = parts[0].strip()
-                name = parts[1].strip() if len(parts) > 1 else ""
-                orders.append((character, name))  # Keep empty string for no personalization
-        
-        # Update preview
+        orders, malformed = _parse_order_lines(text)
+
+        # Update preview - build the whole table first so Tk gets a single insert
+        lines = [f"{'Character':<30} {'Name':<25}\n", "-" * 55 + "\n"]
+        lines.extend(f"{character:<30} {name or '(no name)':<25}\n" for character, name, _ in orders)
+        if malformed:
+            lines.append(f"\n⚠ Skipped {len(malformed)} malformed line(s) (check the quotes):\n")
+            lines.extend(f"  {line}\n" for line in malformed)
         self.preview_text.delete(1.0, tk.END)
-        self.preview_text.insert(tk.END, f"{'Character':<30} {'Name':<25}\n")
-        self.preview_text.insert(tk.END, "-" * 55 + "\n")
-        
-        for character, name in orders:
-            display_name = name if name else "(no name)"
-            self.preview_text.insert(tk.END, f"{character:<30} {display_name:<25}\n")
+        self.preview_text.insert(tk.END, ''.join(lines))
         
-        self.orders_count.set(f"{len(orders)} orders")
-        self.status_text.set(f"Preview ready: {len(orders)} orders")
+        self.orders_count.set(_order_count_text(orders, malformed))
+        self.status_text.set(f"Preview ready: {_order_count_text(orders, malformed)}")
         
         # Show image preview window
         self.show_image_preview(orders)
     
     def show_image_preview(self, orders):
         """Show an interactive window to edit orders with image previews"""
-        try:
-            from PIL import Image, ImageTk
-        except ImportError:
+        if ImageTk is None:
             messagebox.showinfo("Preview Unavailable", "Image preview requires the Pillow library.\nInstall it with: pip install Pillow")
             return
         
@@ -768,17 +1209,26 @@ pluto-captain,Sophia"""
         # Get boats directory
         boats_dir = "boats"
         
-        # Get all available images (characters + boats)
-        available_images = []
-        for file in sorted(os.listdir(images_dir)):
-            if file.lower().endswith('.png'):
-                available_images.append(file.replace('.png', ''))
+        # Get all available images (characters + boats) - cached until the folders change
+        image_files, _ = _scan_images(images_dir)
+        available_images = [file[:-4] for file in image_files]
         
+        # Full path for every lowercased image name, built once (fhm_images wins over boats on a clash)
+        image_paths = {}
+
         # Add boat images if boats folder exists
         if os.path.exists(boats_dir):
-            for file in sorted(os.listdir(boats_dir)):
-                if file.lower().endswith('.png'):
-                    available_images.append(file.replace('.png', ''))
+            boat_files, _ = _scan_images(boats_dir)
+            available_images.extend(file[:-4] for file in boat_files)
+            image_paths.update((file[:-4].lower(), os.path.join(boats_dir, file)) for file in boat_files)
+        image_paths.update((file[:-4].lower(), os.path.join(images_dir, file)) for file in image_files)
+        
+        # Lowercased names for the search dialog, built once per preview window
+        available_images_lower = [img.lower() for img in available_images]
+        
+        def find_image_path(char):
+            """Path to a character's image (fhm_images first, then boats, any case), or None"""
+            return image_paths.get(char.lower())
         
         # Create preview window
         preview_window = tk.Toplevel(self.root)
@@ -819,7 +1269,13 @@ pluto-captain,Sophia"""
         scrollable_frame = tk.Frame(canvas, bg="white")
         
         canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        # Scrolling (or the content growing) may bring rows with unloaded thumbnails into view
+        def on_canvas_scroll(first, last):
+            scrollbar.set(first, last)
+            schedule_thumbnail_loading()
+        
+        canvas.configure(yscrollcommand=on_canvas_scroll)
         
         # Update scroll region when content changes
         scrollable_frame.bind(
@@ -852,7 +1308,7 @@ pluto-captain,Sophia"""
             canvas.yview_scroll(1, "units")
         
         # Bind mouse wheel events based on platform
-        system = platform.system()
+        system = _SYSTEM
         if system == 'Darwin':  # macOS
             canvas.bind_all("<MouseWheel>", on_mac_mousewheel)
             canvas.bind_all("<Button-4>", on_button_4)
@@ -863,9 +1319,82 @@ pluto-captain,Sophia"""
         else:  # Windows
             canvas.bind_all("<MouseWheel>", on_mousewheel)
         
+        # Decode a source image down to preview size (reusing the on-disk cache while the file is unchanged)
+        def load_thumbnail(path):
+            key = _thumb_cache_key(path)
+            if self._thumb_db is not None:
+                cached = self._thumb_db.get(key)
+                if cached:
+                    size, mode, data = cached
+                    return Image.frombytes(mode, size, data)
+            
+            img = _make_thumbnail(path)
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGBA')
+            
+            if self._thumb_db is not None:
+                self._thumb_db[key] = (img.size, img.mode, img.tobytes())
+            return img
+        
+        # Recently shown thumbnails by path, so reselecting a character skips the decode
+        thumb_photos = OrderedDict()
+        
+        def get_thumbnail_photo(path):
+            photo = thumb_photos.get(path)
+            if photo is not None:
+                thumb_photos.move_to_end(path)
+                return photo
+            photo = ImageTk.PhotoImage(load_thumbnail(path))
+            thumb_photos[path] = photo
+            if len(thumb_photos) > PREVIEW_PHOTO_CACHE_SIZE:
+                thumb_photos.popitem(last=False)
+            return photo
+
         # Store order data (will be updated as user edits)
         order_data = []
         order_widgets = []  # Store references to widgets for updates
+        pending_rows = deque()  # Orders whose rows haven't been built yet
+        pending_thumbs = {}  # Row index -> image path for thumbnails not decoded yet
+        summary_counts = {'found': 0, 'total': 0}  # Kept up to date by row create/edit/delete
+        thumb_state = {'after_id': None}
+        
+        # Decode thumbnails only for rows in (or near) the visible part of the canvas
+        def schedule_thumbnail_loading():
+            if thumb_state['after_id'] is None and pending_thumbs:
+                thumb_state['after_id'] = preview_window.after_idle(load_pending_thumbnails)
+        
+        def load_pending_thumbnails():
+            thumb_state['after_id'] = None
+            if not pending_thumbs or not preview_window.winfo_exists():
+                return
+            top = canvas.canvasy(0) - PREVIEW_THUMB_MARGIN
+            bottom = canvas.canvasy(canvas.winfo_height()) + PREVIEW_THUMB_MARGIN
+            
+            # Rows are stacked in index order, so stop at the first one below the view
+            batch = []
+            for idx in pending_thumbs:
+                frame = order_widgets[idx]['frame']
+                y = frame.winfo_y()
+                if y + frame.winfo_height() < top:
+                    continue
+                if y > bottom or len(batch) == PREVIEW_ROW_BATCH:
+                    break
+                batch.append(idx)
+            
+            for idx in batch:
+                path = pending_thumbs.pop(idx)
+                img_lbl = order_widgets[idx]['img_label']
+                try:
+                    # Rows showing the same character share one PhotoImage
+                    photo = get_thumbnail_photo(path)
+                    img_lbl.config(image=photo, text="")
+                    img_lbl.image = photo
+                except:
+                    img_lbl.config(text="No\nImage", font=("Segoe UI", 10))
+            
+            # A full batch may mean more visible rows are waiting
+            if len(batch) == PREVIEW_ROW_BATCH:
+                thumb_state['after_id'] = preview_window.after(1, load_pending_thumbnails)
         
         # Function to create an order row
         def create_order_row(character="", name="", year=""):
@@ -883,31 +1412,14 @@ pluto-captain,Sophia"""
             image_container.pack_propagate(False)  # Prevent resizing
             
             # Load initial image - check both fhm_images and boats folders
-            image_filename = f"{character}.png"
-            image_path = os.path.join(images_dir, image_filename)
-            
-            # If not found in images_dir, check boats folder
-            if not os.path.exists(image_path) and os.path.exists(boats_dir):
-                boat_image_path = os.path.join(boats_dir, image_filename)
-                if os.path.exists(boat_image_path):
-                    image_path = boat_image_path
+            image_path = find_image_path(character)
             
-            photo = None
-            if os.path.exists(image_path):
-                try:
-                    img = Image.open(image_path)
-                    img.thumbnail((100, 100), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(img)
-                except:
-                    photo = None
-            
-            # Image label - fills the container
+            # Image label - fills the container; the thumbnail itself is decoded after the row is shown
             img_label = tk.Label(image_container, bg="#f0f0f0", relief=tk.SUNKEN, bd=1)
-            if photo:
-                img_label.config(image=photo)
-                if not hasattr(self, '_preview_images'):
-                    self._preview_images = []
-                self._preview_images.append(photo)
+            if image_path:
+                img_label.config(text="Loading...", font=("Segoe UI", 9), fg="#999")
+                pending_thumbs[idx] = image_path
+                schedule_thumbnail_loading()
             else:
                 img_label.config(text="No\nImage", font=("Segoe UI", 10), fg="#999")
             img_label.pack(fill=tk.BOTH, expand=True)
@@ -1012,21 +1524,18 @@ pluto-captain,Sophia"""
             
             status_label = tk.Label(
                 action_row,
-                text="✓ Ready" if os.path.exists(image_path) else "⚠ Not found",
+                text="✓ Ready" if image_path else "⚠ Not found",
                 font=("Segoe UI", 8),
                 bg="white",
-                fg="#5cb85c" if os.path.exists(image_path) else "#f0ad4e"
+                fg="#5cb85c" if image_path else "#f0ad4e"
             )
             status_label.pack(side=tk.LEFT)
             
             # Delete button
-            def make_delete_handler(idx):
-                return lambda: delete_order(idx)
-            
             delete_btn = tk.Button(
                 action_row,
                 text="🗑️ Delete",
-                command=make_delete_handler(idx),
+                command=lambda i=idx: delete_order(i),
                 font=("Segoe UI", 8),
                 bg="#d9534f",
                 fg="white",
@@ -1037,53 +1546,16 @@ pluto-captain,Sophia"""
             )
             delete_btn.pack(side=tk.RIGHT, padx=(5, 0))
             
-            # Function to update image when character changes
-            def make_update_handler(idx, img_lbl, char_v, name_v, year_v, status_lbl):
-                def update_image(*args):
-                    new_char = char_v.get()
-                    order_data[idx]['character'] = new_char
-                    order_data[idx]['name'] = name_v.get()
-                    order_data[idx]['year'] = year_v.get()
-                    
-                    # Update image - check both fhm_images and boats folders
-                    new_image_path = os.path.join(images_dir, f"{new_char}.png")
-                    
-                    # If not found in images_dir, check boats folder
-                    if not os.path.exists(new_image_path) and os.path.exists(boats_dir):
-                        boat_path = os.path.join(boats_dir, f"{new_char}.png")
-                        if os.path.exists(boat_path):
-                            new_image_path = boat_path
-                    
-                    if os.path.exists(new_image_path):
-                        try:
-                            img = Image.open(new_image_path)
-                            img.thumbnail((100, 100), Image.Resampling.LANCZOS)
-                            new_photo = ImageTk.PhotoImage(img)
-                            img_lbl.config(image=new_photo, text="", bg="#f0f0f0")
-                            self._preview_images.append(new_photo)
-                            status_lbl.config(text="✓ Ready", fg="#5cb85c")
-                        except:
-                            img_lbl.config(image="", text="Error\nLoading", bg="#fff0f0")
-                            status_lbl.config(text="❌ Error", fg="#d9534f")
-                    else:
-                        img_lbl.config(image="", text="No\nImage", bg="#f0f0f0")
-                        status_lbl.config(text="⚠ Not found", fg="#f0ad4e")
-                return update_image
-            
-            update_handler = make_update_handler(idx, img_label, char_var, name_var, year_var, status_label)
-            # Update data when fields change
-            char_var.trace_add('write', lambda *args, h=update_handler: h())
-            name_var.trace_add('write', lambda *args, i=idx, n=name_var: order_data[i].update({'name': n.get()}))
-            year_var.trace_add('write', lambda *args, i=idx, y=year_var: order_data[i].update({'year': y.get()}))
-            
-            # Search button (after update_handler exists so we can pass it as callback)
-            def make_search_handler(char_v, update_h):
-                return lambda: open_image_search(char_v, on_select_callback=update_h)
+            # Update data when fields change (the character only changes through the
+            # search dialog, which calls update_row_image itself once a choice is made)
+            name_var.trace_add('write', lambda *args, i=idx: set_row_field(i, 'name'))
+            year_var.trace_add('write', lambda *args, i=idx: set_row_field(i, 'year'))
             
+            # Search button
             search_btn = tk.Button(
                 char_row,
                 text="🔍 Search",
-                command=make_search_handler(char_var, update_handler),
+                command=lambda i=idx: open_image_search(order_widgets[i]['char_var'], on_select_callback=lambda: update_row_image(i)),
                 font=("Segoe UI", 9),
                 bg="#17a2b8",
                 fg="white",
@@ -1100,10 +1572,13 @@ pluto-captain,Sophia"""
                 'name_var': name_var,
                 'year_var': year_var,
                 'img_label': img_label,
-                'status_label': status_label
+                'status_label': status_label,
+                'found': image_path is not None
             })
+            summary_counts['total'] += 1
+            if image_path:
+                summary_counts['found'] += 1
             
-            update_summary()
             return idx
         
         # Image search dialog
@@ -1180,17 +1655,41 @@ pluto-captain,Sophia"""
             listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             scrollbar.config(command=listbox.yview)
             
+            # Large result sets are loaded a page at a time as the list is scrolled
+            list_state = {'items': [], 'loaded': 0}
+            
+            def load_more_rows():
+                start = list_state['loaded']
+                page = list_state['items'][start:start + SEARCH_LIST_PAGE]
+                if page:
+                    listbox.insert(tk.END, *page)
+                list_state['loaded'] = start + len(page)
+            
+            def on_list_scroll(first, last):
+                scrollbar.set(first, last)
+                if float(last) > 0.9 and list_state['loaded'] < len(list_state['items']):
+                    load_more_rows()
+            
+            listbox.config(yscrollcommand=on_list_scroll)
+            
             # Populate initial list
             def update_list(query=""):
                 listbox.delete(0, tk.END)
                 
                 if query:
-                    filtered = [img for img in available_images if query.lower() in img.lower()]
+                    query = query.lower()
+                    filtered = [img for img, low in zip(available_images, available_images_lower) if query in low]
                 else:
                     filtered = available_images
                 
-                for item in filtered:
-                    listbox.insert(tk.END, item)
+                # One insert call for the whole list instead of one Tcl call per row
+                list_state['items'] = filtered
+                list_state['loaded'] = 0
+                if len(filtered) > SEARCH_LIST_LAZY_THRESHOLD:
+                    load_more_rows()
+                elif filtered:
+                    listbox.insert(tk.END, *filtered)
+                    list_state['loaded'] = len(filtered)
                 
                 count_label.config(text=f"{len(filtered)} matches")
                 
@@ -1202,9 +1701,18 @@ pluto-captain,Sophia"""
             # Initial population
             update_list()
             
-            # Bind search
+            # Bind search - refilter once typing pauses rather than on every keystroke
+            search_state = {'after_id': None}
+            
+            def run_search():
+                search_state['after_id'] = None
+                if search_window.winfo_exists():
+                    update_list(search_var.get())
+            
             def on_search_change(*args):
-                update_list(search_var.get())
+                if search_state['after_id']:
+                    search_window.after_cancel(search_state['after_id'])
+                search_state['after_id'] = search_window.after(150, run_search)
             
             search_var.trace_add('write', on_search_change)
             
@@ -1222,6 +1730,10 @@ pluto-captain,Sophia"""
             
             # Select on Enter key
             def on_enter(event):
+                # Apply a search that is still waiting on the debounce
+                if search_state['after_id']:
+                    search_window.after_cancel(search_state['after_id'])
+                    run_search()
                 selection = listbox.curselection()
                 if selection:
                     selected = listbox.get(selection[0])
@@ -1248,7 +1760,7 @@ pluto-captain,Sophia"""
                 listbox.yview_scroll(1, "units")
             
             # Bind based on platform
-            system = platform.system()
+            system = _SYSTEM
             if system == 'Darwin':  # macOS
                 listbox.bind("<MouseWheel>", on_listbox_mac_mousewheel)
                 listbox.bind("<Button-4>", on_listbox_button_4)
@@ -1313,33 +1825,96 @@ pluto-captain,Sophia"""
                 fg="#999"
             ).pack(pady=(0, 10))
         
+        # Row handlers - rows are looked up by index, so each row only holds small lambdas
+        
+        # Name/year edits only store the text; the image reloads on character changes only
+        def set_row_field(idx, key):
+            order_data[idx][key] = order_widgets[idx][f'{key}_var'].get()
+        
+        # Update a row's image after its character changes
+        def update_row_image(idx):
+            row = order_widgets[idx]
+            img_lbl = row['img_label']
+            status_lbl = row['status_label']
+            new_char = row['char_var'].get()
+            order_data[idx]['character'] = new_char
+            pending_thumbs.pop(idx, None)  # Drop any queued load of the old image
+            
+            # Update image - check both fhm_images and boats folders
+            new_image_path = find_image_path(new_char)
+            
+            found = new_image_path is not None
+            if found != row['found']:
+                summary_counts['found'] += 1 if found else -1
+                row['found'] = found
+                update_summary()
+            
+            if new_image_path:
+                try:
+                    new_photo = get_thumbnail_photo(new_image_path)
+                    img_lbl.config(image=new_photo, text="", bg="#f0f0f0")
+                    img_lbl.image = new_photo  # Keep it alive after it leaves the LRU
+                    status_lbl.config(text="✓ Ready", fg="#5cb85c")
+                except:
+                    img_lbl.config(image="", text="Error\nLoading", bg="#fff0f0")
+                    status_lbl.config(text="❌ Error", fg="#d9534f")
+            else:
+                img_lbl.config(image="", text="No\nImage", bg="#f0f0f0")
+                status_lbl.config(text="⚠ Not found", fg="#f0ad4e")
+        
         # Delete order function
         def delete_order(idx):
             if messagebox.askyesno("Delete Order", f"Delete order #{idx + 1}?"):
-                order_widgets[idx]['frame'].destroy()
+                row = order_widgets[idx]
+                row['frame'].destroy()
+                # Drop the traces so the row's variables can be freed with its widgets
+                for var in (row['name_var'], row['year_var']):
+                    for mode, callback in var.trace_info():
+                        var.trace_remove(mode, callback)
                 order_data[idx] = None  # Mark as deleted
+                order_widgets[idx] = None
+                pending_thumbs.pop(idx, None)
+                summary_counts['total'] -= 1
+                if row['found']:
+                    summary_counts['found'] -= 1
                 update_summary()
         
         # Function to update summary
         def update_summary():
-            active_orders = [o for o in order_data if o is not None]
-            # Check both fhm_images and boats folders for image existence
-            def image_exists(char):
-                if os.path.exists(os.path.join(images_dir, f"{char}.png")):
-                    return True
-                if os.path.exists(boats_dir) and os.path.exists(os.path.join(boats_dir, f"{char}.png")):
-                    return True
-                return False
-            found = sum(1 for o in active_orders if image_exists(o['character']))
-            missing = len(active_orders) - found
-            summary_label.config(text=f"✓ Ready: {found}  |  ⚠ Issues: {missing}  |  Total: {len(active_orders)}")
+            found = summary_counts['found']
+            total = summary_counts['total']
+            summary = f"✓ Ready: {found}  |  ⚠ Issues: {total - found}  |  Total: {total}"
+            if pending_rows:
+                summary += f"  |  Loading {len(pending_rows)} more..."
+            summary_label.config(text=summary)
+
+        # Build queued rows (all of them when limit is None)
+        def build_pending_rows(limit=None):
+            built = 0
+            while pending_rows and (limit is None or built < limit):
+                character, name, year = pending_rows.popleft()
+                create_order_row(character, name, year)
+                built += 1
+            # One summary refresh per batch rather than a full rescan per row
+            if built:
+                update_summary()
+
+        # Keep building rows in small batches so the window stays responsive
+        def build_rows_in_background():
+            if not pending_rows or not preview_window.winfo_exists():
+                return
+            build_pending_rows(PREVIEW_ROW_BATCH)
+            if pending_rows:
+                preview_window.after(10, build_rows_in_background)
         
         # Add Order button (above canvas)
         add_order_frame = tk.Frame(preview_window, bg="white")
         add_order_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
         
         def add_new_order():
+            build_pending_rows()  # New order goes after every existing one
             create_order_row("", "")
+            update_summary()
             # Scroll to bottom
             canvas.update_idletasks()
             canvas.yview_moveto(1.0)
@@ -1376,23 +1951,36 @@ pluto-captain,Sophia"""
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        # Initialize existing orders (AFTER canvas is packed)
-        for character, name in orders:
-            create_order_row(character, name)
+        # Initialize existing orders (AFTER canvas is packed) - first screenful now, the rest in the background
+        pending_rows.extend(orders)
+        build_pending_rows(PREVIEW_ROW_BATCH)
         
         # Force canvas to update its scroll region
         canvas.update_idletasks()
         canvas.configure(scrollregion=canvas.bbox("all"))
         
         update_summary()
+        preview_window.after(10, build_rows_in_background)
         
         # Buttons
         button_frame = tk.Frame(bottom_frame, bg="#f0f0f0")
         button_frame.pack(pady=(0, 15))
         
+        # Write edited orders back to the main input (include year for boats if present)
+        def write_orders_to_input(active_orders):
+            orders_text = '\n'.join(
+                _format_order_line(o['character'], o['name'], o.get('year', '')) for o in active_orders
+            )
+            self.order_input.delete(1.0, tk.END)
+            self.order_input.insert(1.0, orders_text)
+            self.set_order_placeholder(False)
+            # Every line written has a comma, so the count is known without re-reading the widget
+            self.orders_count.set(f"{len(active_orders)} orders")
+        
         # Confirm and Process button
         def confirm_and_process():
             # Collect active orders
+            build_pending_rows()
             active_orders = [o for o in order_data if o is not None]
             
             if not active_orders:
@@ -1402,9 +1990,7 @@ pluto-captain,Sophia"""
             # Check for missing images (check both fhm_images and boats folders)
             missing = []
             for o in active_orders:
-                char_image_path = os.path.join(images_dir, f"{o['character']}.png")
-                boat_image_path = os.path.join(boats_dir, f"{o['character']}.png") if os.path.exists(boats_dir) else None
-                if not os.path.exists(char_image_path) and (boat_image_path is None or not os.path.exists(boat_image_path)):
+                if not find_image_path(o['character']):
                     display_name = o['name'] if o['name'] else "(no name)"
                     missing.append(f"{o['character']} (for {display_name})")
             
@@ -1420,18 +2006,8 @@ pluto-captain,Sophia"""
                 if not response:
                     return
             
-            # Update main input with edited orders (include year for boats if present)
-            def format_order(o):
-                year = o.get('year', '')
-                if year:
-                    return f"{o['character']},{o['name']},{year}"
-                return f"{o['character']},{o['name']}"
-            
-            orders_text = '\n'.join([format_order(o) for o in active_orders])
-            self.order_input.delete(1.0, tk.END)
-            self.order_input.insert(1.0, orders_text)
-            self.order_input.config(fg="#333")
-            self.update_count()
+            # Update main input with edited orders
+            write_orders_to_input(active_orders)
             
             # Close preview and start processing
             preview_window.destroy()
@@ -1453,23 +2029,13 @@ pluto-captain,Sophia"""
         
         # Update only button
         def update_only():
+            build_pending_rows()
             active_orders = [o for o in order_data if o is not None]
             if not active_orders:
                 messagebox.showwarning("No Orders", "No orders to update!")
                 return
             
-            # Include year for boats if present
-            def format_order(o):
-                year = o.get('year', '')
-                if year:
-                    return f"{o['character']},{o['name']},{year}"
-                return f"{o['character']},{o['name']}"
-            
-            orders_text = '\n'.join([format_order(o) for o in active_orders])
-            self.order_input.delete(1.0, tk.END)
-            self.order_input.insert(1.0, orders_text)
-            self.order_input.config(fg="#333")
-            self.update_count()
+            write_orders_to_input(active_orders)
             
             messagebox.showinfo("Updated", "Orders updated in the main window!")
             preview_window.destroy()
@@ -1513,14 +2079,12 @@ pluto-captain,Sophia"""
             preview_window.unbind_all("<MouseWheel>")
             preview_window.unbind_all("<Button-4>")
             preview_window.unbind_all("<Button-5>")
-            if hasattr(self, '_preview_images'):
-                self._preview_images.clear()
             preview_window.destroy()
         
         preview_window.protocol("WM_DELETE_WINDOW", lambda: cancel())
             
-    def log(self, message, level="info"):
-        """Add message to log"""
+    def format_log_line(self, message, level="info"):
+        """Format a log line with timestamp and level prefix"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         
         if level == "error":
@@ -1536,15 +2100,37 @@ pluto-captain,Sophia"""
             prefix = "ℹ"
             color = "#74c0fc"
         
-        self.log_text.insert(tk.END, f"[{timestamp}] {prefix} {message}\n")
+        return f"[{timestamp}] {prefix} {message}\n"
+    
+    def log(self, message, level="info"):
+        """Add message to log"""
+        self.log_text.insert(tk.END, self.format_log_line(message, level))
         self.log_text.see(tk.END)
-        self.root.update_idletasks()
+    
+    def queue_log(self, message, level="info"):
+        """Add message to log from a worker thread (written on the next pump)"""
+        self._log_queue.put(self.format_log_line(message, level))
+    
+    def pump_log_queue(self):
+        """Write all queued log lines in one insert, then check again in 50 ms"""
+        lines = []
+        try:
+            while True:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if lines:
+            self.log_text.insert(tk.END, ''.join(lines))
+            self.log_text.see(tk.END)
+        
+        self.root.after(50, self.pump_log_queue)
         
     def process_orders(self):
         """Process the orders"""
         text = self.order_input.get(1.0, tk.END).strip()
         
-        if not text or self.order_input.cget("fg") == "#999":
+        if not text or self._order_input_is_placeholder:
             messagebox.showwarning("No Orders", "Please add orders first.")
             return
         
@@ -1552,26 +2138,21 @@ pluto-captain,Sophia"""
             messagebox.showinfo("Processing", "Already processing orders...")
             return
         
-        # Parse and validate orders
-        orders = []
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if ',' in line:
-                parts = line.split(',')
-                character = parts[0].strip()
-                name = parts[1].strip() if len(parts) > 1 else ""
-                year = parts[2].strip() if len(parts) > 2 else ""
-                orders.append((character, name, year))
+        # Parse and validate orders - csv keeps quoted names with commas intact
+        orders, malformed = _parse_order_lines(text)
+        
+        if malformed:
+            messagebox.showerror(
+                "Malformed Orders",
+                f"{len(malformed)} line(s) could not be read (check the quotes):\n\n" + '\n'.join(malformed[:10])
+            )
+            return
         
         if not orders:
             messagebox.showwarning("No Valid Orders", "Please add at least one valid order.")
             return
         
         # Save to temp CSV for processing
-        import tempfile
         temp_csv = os.path.join(tempfile.gettempdir(), "temp_orders.csv")
         try:
             with open(temp_csv, 'w', newline='', encoding='utf-8') as f:
@@ -1598,15 +2179,16 @@ pluto-captain,Sophia"""
             os.makedirs(archive_dir, exist_ok=True)
             
             # Find all order PDFs (magnets, boats, and master)
-            pdf_files = []
-            for file in os.listdir('.'):
-                if (file.startswith('order_output_') or file.startswith('boat_output_') or file.startswith('MASTER_ORDER_')) and file.endswith('.pdf'):
-                    pdf_files.append(file)
+            with os.scandir('.') as entries:
+                pdf_files = [
+                    entry.name for entry in entries
+                    if entry.name.startswith(('order_output_', 'boat_output_', 'MASTER_ORDER_')) and entry.name.endswith('.pdf')
+                ]
             
             if not pdf_files:
                 return
             
-            self.log(f"Archiving {len(pdf_files)} old PDF(s)...", "info")
+            self.queue_log(f"Archiving {len(pdf_files)} old PDF(s)...", "info")
             
             # Move PDFs to archive
             for pdf_file in pdf_files:
@@ -1616,32 +2198,29 @@ pluto-captain,Sophia"""
                         os.remove(dest)  # Remove if exists
                     shutil.move(pdf_file, dest)
                 except Exception as e:
-                    self.log(f"Could not archive {pdf_file}: {str(e)}", "warning")
+                    self.queue_log(f"Could not archive {pdf_file}: {str(e)}", "warning")
             
             # Clean up old archives (keep last 10 master PDFs)
-            archive_masters = []
-            for file in os.listdir(archive_dir):
-                if file.startswith('MASTER_ORDER_') and file.endswith('.pdf'):
-                    file_path = os.path.join(archive_dir, file)
-                    mtime = os.path.getmtime(file_path)
-                    archive_masters.append((mtime, file_path))
-            
-            # Sort by modification time (newest first)
-            archive_masters.sort(reverse=True)
-            
-            # Delete old ones beyond the 10 most recent
+            # scandir hands back the stat with each entry, so no separate getmtime per file
+            with os.scandir(archive_dir) as entries:
+                archive_masters = [
+                    (entry.stat().st_mtime, entry.path) for entry in entries
+                    if entry.name.startswith('MASTER_ORDER_') and entry.name.endswith('.pdf')
+                ]
+            
+            # Delete the oldest ones beyond the 10 most recent
             if len(archive_masters) > 10:
-                for _, file_path in archive_masters[10:]:
+                for _, file_path in heapq.nsmallest(len(archive_masters) - 10, archive_masters):
                     try:
                         os.remove(file_path)
-                        self.log(f"Deleted old archive: {os.path.basename(file_path)}", "info")
+                        self.queue_log(f"Deleted old archive: {os.path.basename(file_path)}", "info")
                     except Exception as e:
-                        self.log(f"Could not delete {file_path}: {str(e)}", "warning")
+                        self.queue_log(f"Could not delete {file_path}: {str(e)}", "warning")
             
-            self.log(f"✓ Archived old PDFs (keeping last 10 masters)", "success")
+            self.queue_log(f"✓ Archived old PDFs (keeping last 10 masters)", "success")
             
         except Exception as e:
-            self.log(f"Warning: Cleanup failed: {str(e)}", "warning")
+            self.queue_log(f"Warning: Cleanup failed: {str(e)}", "warning")
     
     def process_orders_thread(self):
         """Process orders in background thread"""
@@ -1669,9 +2248,9 @@ pluto-captain,Sophia"""
                 def flush(self):
                     pass
             
-            sys.stdout = LogRedirector(lambda msg: self.root.after(0, self.log, msg))
+            sys.stdout = LogRedirector(self.queue_log)
             
-            self.log("Starting order processing...", "info")
+            self.queue_log("Starting order processing...", "info")
             self.progress_var.set(10)
             
             # Call the processing function
@@ -1683,19 +2262,18 @@ pluto-captain,Sophia"""
             self.progress_var.set(100)
             
             if success:
-                self.log("✓ Processing complete!", "success")
+                self.queue_log("✓ Processing complete!", "success")
                 self.view_btn.config(state=tk.NORMAL)
                
-                # Find all individual magnet PDFs
+                # Find all individual magnet and boat PDFs in one directory pass
                 magnet_pdf_files = []
-                for file in sorted(os.listdir('.')):
-                    if file.startswith('order_output_') and file.endswith('.pdf'):
-                        magnet_pdf_files.append(file)
-                
-                # Find all boat PDFs
                 boat_pdf_files = []
-                for file in sorted(os.listdir('.')):
-                    if file.startswith('boat_output_') and file.endswith('.pdf'):
+                with os.scandir('.') as entries:
+                    pdf_names = sorted(e.name for e in entries if e.name.endswith('.pdf') and e.is_file())
+                for file in pdf_names:
+                    if file.startswith('order_output_'):
+                        magnet_pdf_files.append(file)
+                    elif file.startswith('boat_output_'):
                         boat_pdf_files.append(file)
                 
                 # Combine: magnets first, then boats at the end
@@ -1703,7 +2281,7 @@ pluto-captain,Sophia"""
                
                 if all_pdf_files:
                     # === Flatten each individual PDF in place ===
-                    self.log("Flattening individual PDFs (removing hidden layers/data)...", "info")
+                    self.queue_log("Flattening individual PDFs (removing hidden layers/data)...", "info")
                     for pdf_file in all_pdf_files:
                         if os.path.exists(pdf_file):
                             self.flatten_pdf_in_place(pdf_file, dpi=300)
@@ -1714,7 +2292,7 @@ pluto-captain,Sophia"""
                    
                     if self.merge_pdfs(all_pdf_files, master_pdf_name):
                         # === Flatten the master PDF ===
-                        self.log("Flattening master PDF...", "info")
+                        self.queue_log("Flattening master PDF...", "info")
                         self.flatten_pdf_in_place(master_pdf_name, dpi=300)
                         # ==============================
 
@@ -1724,11 +2302,11 @@ pluto-captain,Sophia"""
                        
                         # Automatically open the (now flattened) master PDF
                         try:
-                            self.log(f"Opening master PDF...", "info")
+                            self.queue_log(f"Opening master PDF...", "info")
                             open_file_or_folder(master_pdf_name)
                             time.sleep(0.5)  # Give system time to open the file
                         except Exception as e:
-                            self.log(f"Could not auto-open PDF: {e}", "warning")
+                            self.queue_log(f"Could not auto-open PDF: {e}", "warning")
                        
                         magnet_count = len(magnet_pdf_files)
                         boat_count = len(boat_pdf_files)
@@ -1758,11 +2336,11 @@ pluto-captain,Sophia"""
                         "Check outputs/ folder for images"
                     )
             else:
-                self.log("Processing completed with errors", "warning")
+                self.queue_log("Processing completed with errors", "warning")
                 self.status_text.set("Processing completed with errors")
                 
         except Exception as e:
-            self.log(f"ERROR: {str(e)}", "error")
+            self.queue_log(f"ERROR: {str(e)}", "error")
             self.status_text.set(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Processing failed:\n{str(e)}")
             
@@ -1835,43 +2413,58 @@ pluto-captain,Sophia"""
             # Overwrite the original file
             os.replace(temp_path, pdf_path)
 
-            self.log(f"Flattened: {os.path.basename(pdf_path)}", "success")
+            self.queue_log(f"Flattened: {os.path.basename(pdf_path)}", "success")
         except Exception as e:
-            self.log(f"Failed to flatten {os.path.basename(pdf_path)}: {str(e)}", "error")
+            self.queue_log(f"Failed to flatten {os.path.basename(pdf_path)}: {str(e)}", "error")
             # If flattening fails, keep the original (non-flattened) file                
     def merge_pdfs(self, pdf_files, output_path):
         """Merge multiple PDF files into one master PDF"""
         try:
-            from PyPDF2 import PdfReader, PdfWriter
-            
-            self.log(f"Merging {len(pdf_files)} PDFs into master PDF...", "info")
-            
-            writer = PdfWriter()
-            
-            for pdf_file in pdf_files:
-                if os.path.exists(pdf_file):
-                    reader = PdfReader(pdf_file)
-                    for page in reader.pages:
-                        writer.add_page(page)
-                    self.log(f"  Added {pdf_file}", "info")
-            
-            with open(output_path, 'wb') as output_file:
-                writer.write(output_file)
-            
-            self.log(f"✓ Master PDF created: {output_path}", "success")
+            self.queue_log(f"Merging {len(pdf_files)} PDFs into master PDF...", "info")
+            
+            # PyMuPDF copies whole documents in C, rather than page by page through Python objects.
+            # Every MERGE_BATCH_SIZE PDFs the result is appended to disk and reopened, so only
+            # the current batch is held in memory.
+            merged = fitz.open()
+            flushed = False
+            added = 0
+            try:
+                for pdf_file in pdf_files:
+                    if os.path.exists(pdf_file):
+                        with fitz.open(pdf_file) as src:
+                            merged.insert_pdf(src)
+                        self.queue_log(f"  Added {pdf_file}", "info")
+                        added += 1
+                        
+                        if added % MERGE_BATCH_SIZE == 0:
+                            if flushed:
+                                merged.saveIncr()
+                            else:
+                                merged.save(output_path)
+                                flushed = True
+                            merged.close()
+                            merged = fitz.open(output_path)
+                
+                if not flushed:
+                    merged.save(output_path)
+                elif added % MERGE_BATCH_SIZE:
+                    merged.saveIncr()
+            finally:
+                merged.close()
+            
+            self.queue_log(f"✓ Master PDF created: {output_path}", "success")
             return True
             
         except Exception as e:
-            self.log(f"Error merging PDFs: {str(e)}", "error")
+            self.queue_log(f"Error merging PDFs: {str(e)}", "error")
             return False
             
     def clear_all(self):
         """Clear all fields"""
         self.csv_path.set("")
         self.order_input.delete(1.0, tk.END)
-        placeholder = "mickey-captain,Johnny\nminnie-captain,Sarah\nstitch-captain,Michael\nmoana-captain,Emma"
-        self.order_input.insert(1.0, placeholder)
-        self.order_input.config(fg="#999")
+        self.order_input.insert(1.0, self.ORDER_PLACEHOLDER)
+        self.set_order_placeholder(True)
         self.preview_text.delete(1.0, tk.END)
         self.log_text.delete(1.0, tk.END)
         self.orders_count.set("0 orders")
@@ -1881,6 +2474,20 @@ pluto-captain,Sophia"""
         self.master_pdf_btn.config(state=tk.DISABLED)
         self.master_pdf_path = None
         
+    def refresh_image_list(self):
+        """Re-read the image folders (just a stat while they're unchanged) and update the count"""
+        self.image_list = tuple(self.get_available_images())
+        # Case-insensitive filename -> real filename, for checking AI matches
+        self.image_lookup = {img.lower(): img for img in self.image_list}
+        self.available_images.set(f"{len(self.image_list)} character images available")
+    
+    def find_listed_image(self, image_file):
+        """Real filename for an AI-returned image (any case, .png optional), or None if there's no such image"""
+        key = image_file.lower()
+        if not key.endswith('.png'):
+            key += '.png'
+        return self.image_lookup.get(key)
+    
     def get_available_images(self):
         """Get list of available images from FHM_Images folder AND boats folder"""
         try:
@@ -1891,39 +2498,30 @@ pluto-captain,Sophia"""
             images_dir = os.path.join(parent_dir, 'FHM_Images')
             
             if os.path.exists(images_dir):
-                for file in os.listdir(images_dir):
-                    if file.lower().endswith('.png'):
-                        image_files.append(file)
-            
+                image_files.extend(_scan_images(images_dir)[0])
+
             # Get boat images from boats folder (same directory as this script)
             boats_dir = "boats"
             if os.path.exists(boats_dir):
-                for file in os.listdir(boats_dir):
-                    if file.lower().endswith('.png'):
-                        image_files.append(file)
+                image_files.extend(_scan_images(boats_dir)[0])
             
             image_files.sort()
             return image_files
-        except Exception as e:
+        except OSError as e:
             print(f"Error getting images: {e}")
             return []
     
     def clear_raw_placeholder(self, event):
         """Clear raw text placeholder"""
         current = self.raw_text.get(1.0, tk.END).strip()
-        if "Paste order details here" in current:
+        if current == self.RAW_PLACEHOLDER:
             self.raw_text.delete(1.0, tk.END)
             self.raw_text.config(fg="#333")
             
     def restore_raw_placeholder(self, event):
         """Restore raw text placeholder if empty"""
         if not self.raw_text.get(1.0, tk.END).strip():
-            placeholder = """Paste order details here, like:
-
-Order #12345 - Mickey Captain themed, names: Johnny, Sarah, Michael
-or
-Disney Cruise Door Magnet - 3 magnets: Minnie, Donald, Goofy (all captain theme)"""
-            self.raw_text.insert(1.0, placeholder)
+            self.raw_text.insert(1.0, self.RAW_PLACEHOLDER)
             self.raw_text.config(fg="#999")
             
     def clear_raw_text(self):
@@ -1953,6 +2551,18 @@ Stitch for Sophia"""
         self.raw_text.config(fg="#333")
         self.status_text.set("Sample order loaded - click 'Parse with AI' to process")
         
+    def show_missing_key_error(self):
+        """Explain where the Grok API key file goes"""
+        messagebox.showerror(
+            "API Key Missing", 
+            "Grok API key not found!\n\n"
+            "Please create a file with your API key at:\n"
+            f"• {GROK_CONFIG_DIR}\\grok_config.txt (recommended)\n"
+            "OR\n"
+            "• grok_config.txt (in this folder)\n\n"
+            "See grok_config.txt.sample for instructions."
+        )
+    
     def parse_with_ai(self):
         """Parse raw order text with Grok AI (reasoning model)"""
         raw_text = self.raw_text.get(1.0, tk.END).strip()
@@ -1965,24 +2575,18 @@ Stitch for Sophia"""
             messagebox.showinfo("Processing", "AI is already processing...")
             return
         
-        if not GROK_API_KEY:
-            parent_dir = os.path.dirname(os.path.abspath(os.getcwd()))
-            messagebox.showerror(
-                "API Key Missing", 
-                "Grok API key not found!\n\n"
-                "Please create a file with your API key at:\n"
-                f"• {parent_dir}\\grok_config.txt (recommended)\n"
-                "OR\n"
-                "• grok_config.txt (in this folder)\n\n"
-                "See grok_config.txt.sample for instructions."
-            )
+        if not reload_grok_key():
+            self.show_missing_key_error()
             return
         
+        # Pick up images added since the app started
+        self.refresh_image_list()
         if not self.image_list:
             messagebox.showerror("No Images", "No images found in FHM_Images folder.\nMake sure it's in the parent directory.")
             return
         
-        # Run in thread with reasoning model
+        # Run in a daemon thread with reasoning model; flag set here so a double-click can't start two
+        self.ai_processing = True
         thread = threading.Thread(target=self.parse_with_ai_thread, args=(raw_text, True))
         thread.daemon = True
         thread.start()
@@ -1999,24 +2603,18 @@ Stitch for Sophia"""
             messagebox.showinfo("Processing", "AI is already processing...")
             return
         
-        if not GROK_API_KEY:
-            parent_dir = os.path.dirname(os.path.abspath(os.getcwd()))
-            messagebox.showerror(
-                "API Key Missing", 
-                "Grok API key not found!\n\n"
-                "Please create a file with your API key at:\n"
-                f"• {parent_dir}\\grok_config.txt (recommended)\n"
-                "OR\n"
-                "• grok_config.txt (in this folder)\n\n"
-                "See grok_config.txt.sample for instructions."
-            )
+        if not reload_grok_key():
+            self.show_missing_key_error()
             return
         
+        # Pick up images added since the app started
+        self.refresh_image_list()
         if not self.image_list:
             messagebox.showerror("No Images", "No images found in FHM_Images folder.\nMake sure it's in the parent directory.")
             return
         
-        # Run in thread with non-reasoning model (faster)
+        # Run in a daemon thread with non-reasoning model (faster); flag set here so a double-click can't start two
+        self.ai_processing = True
         thread = threading.Thread(target=self.parse_with_ai_thread, args=(raw_text, False))
         thread.daemon = True
         thread.start()
@@ -2025,92 +2623,15 @@ Stitch for Sophia"""
         """STAGE 1: Format raw order text into simple character-name pairs"""
         model = "grok-4-1-fast-reasoning" if use_reasoning else "grok-4-1-fast-non-reasoning"
         
-        prompt = f"""You are extracting character and name pairs from Disney magnet order text.
-
-Your job is to format raw order data into a simple, clean list.
-
-IMPORTANT RULES:
-1. Extract ONLY character-name pairs (one per line)
-2. Format EXACTLY as: "Character description - name: PersonName"
-3. For boat orders, extract the boat with its ship name. Format as: "boat ShipName - name: FamilyName"
-4. If a line has BOTH a boat AND regular character orders, extract BOTH the boat AND the regular characters
-5. A single order line can have 1-5 character-name pairs (plus possibly a boat)
-6. Keep character descriptions simple and natural (e.g., "Luke Skywalker", "Stitch captain", "Minnie Spiderman")
-7. Preserve exact name spellings from the order
-8. If no name is specified for a character, use "no name" for the name
-9. Duck and dog orders do not need captain, pirate, etc. Just duck/dog and the ID number with them.
-10. Do not omit any items from the order including boats.
-11. The header for an order determines the theme. For example, if the header is pirate, every item in that order is pirate. Same with captain, christmas, etc. If the order is boat, assume captain theme for the character magnets.
-
-=== BOAT ORDER DETECTION ===
-If the order mentions ANY of these, it includes a BOAT order:
-- "boat" or "ship"
-- Disney cruise ship names: Fantasy, Magic, Wonder, Wish, Dream, Treasure, Destiny
-- "cruise ship door decoration" or similar
-
-BOAT SHIP NAME MAPPING:
-- Disney Fantasy → boat Fantasy
-- Disney Magic → boat Magic
-- Disney Wonder → boat Wonder
-- Disney Wish → boat Wish
-- Disney Dream → boat Dream
-- Disney Treasure → boat Treasure
-- Disney Destiny → boat Destiny
-
-EXAMPLES:
-
-Input: "Item: Captain Mickey, Personalization: Johnny"
-Output: Mickey captain - name: Johnny
-
-Input: "Item: Christmas Elsa\\nPersonalization: Sarah"
-Output: Elsa christmas - name: Sarah
-
-Input: "captain Order has boat +  Minnie for 'Katie' and  Woody for 'Sean' and dog 16 for 'Joni'"
-Output: 
-boat Fantasy - name: Katie
-Minnie captain - name: Katie
-Woody captain - name: Sean
-dog 16 - name: Joni
-
-Input: "Disney Fantasy boat for The Smith Family"
-Output:
-boat Fantasy - name: The Smith Family
-
-Input: "Disney Magic ship for Johnson Crew, also Mickey captain for Johnny"
-Output:
-boat Magic - name: Johnson Crew
-Mickey captain - name: Johnny
-
-Input: "1. Dory Captain - Joni  2. Ariel pirate - Gracie  3. Rapunzel Captain - Lila"
-Output:
-Dory captain - name: Joni
-Ariel pirate - name: Gracie
-Rapunzel captain - name: Lila
-
-Now process this order text:
-{raw_text}
-
-OUTPUT FORMAT: Return ONLY the formatted lines, one per line, no explanations, no markdown, just the text:"""
-        
-        headers = {
-            "Authorization": f"Bearer {GROK_API_KEY}",
-            "Content-Type": "application/json"
-        }
+        prompt = STAGE1_PROMPT.format(raw_text=raw_text)
         
-        data = {
-            "model": model,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.1,
-            "max_tokens": 2000
-        }
+        max_tokens = grok_token_budget(raw_text)
+        data = {**GROK_BASE_DATA, "model": model, "max_tokens": max_tokens,
+                "messages": [{"role": "user", "content": prompt}]}
         
         try:
-            self.root.after(0, lambda: self.log("Stage 1: Sending formatting request to Grok AI...", "info"))
-            response = requests.post(GROK_API_URL, headers=headers, json=data, timeout=60)
-            response.raise_for_status()
-            
-            result = response.json()
-            content = result['choices'][0]['message']['content'].strip()
+            self.root.after(0, lambda: self.log(f"Stage 1: Sending formatting request to Grok AI (max {max_tokens} tokens)...", "info"))
+            content = self.stream_grok_completion(data, "Stage 1").strip()
             
             # Clean up the response - remove markdown code blocks if present
             if content.startswith('```'):
@@ -2126,48 +2647,72 @@ OUTPUT FORMAT: Return ONLY the formatted lines, one per line, no explanations, n
             self.root.after(0, lambda msg=error_msg: self.log(f"Stage 1 Error: {msg}", "error"))
             return None
         
+    def stream_grok_completion(self, data, stage_label, stop_after_json=False):
+        """Request a streamed chat completion and return the message text (optionally up to the first complete JSON value)"""
+        payload = dict(data, stream=True)
+        parts = []
+        received_lines = 0
+        json_scan = {'depth': 0, 'in_str': False, 'escape': False}
+        
+        with GROK_SESSION.post(GROK_API_URL, headers=GROK_HEADERS, json=payload, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            
+            # Server-sent events: one "data: {...}" line per chunk, ending with "data: [DONE]"
+            for raw_line in response.iter_lines():
+                line = raw_line.decode('utf-8', 'replace')
+                if not line.startswith('data:'):
+                    continue
+                chunk = line[5:].strip()
+                if chunk == '[DONE]':
+                    break
+                
+                choices = _json_loads(chunk).get('choices') or [{}]
+                delta = choices[0].get('delta', {}).get('content')
+                if not delta:
+                    continue
+                parts.append(delta)
+                
+                # Show progress as whole lines arrive
+                if '\n' in delta:
+                    received_lines += delta.count('\n')
+                    self.root.after(0, lambda n=received_lines: self.status_text.set(f"{stage_label}: received {n} lines from AI..."))
+                
+                # Anything after the closing bracket is ignored by the parser, so stop reading there
+                if stop_after_json and _scan_json_chunk(json_scan, delta):
+                    break
+        
+        return ''.join(parts)
+    
     def parse_with_ai_thread(self, raw_text, use_reasoning=True):
         """Parse with AI in background thread - 2-STAGE SYSTEM"""
         try:
-            self.ai_processing = True
-            # Disable both AI buttons
-            self.root.after(0, lambda: self.ai_parse_btn.config(state=tk.DISABLED, text="🤖 Processing..."))
-            self.root.after(0, lambda: self.quick_parse_btn.config(state=tk.DISABLED, text="⚡ Processing..."))
-            
             model_type = "reasoning" if use_reasoning else "quick"
-            self.root.after(0, lambda: self.status_text.set(f"AI is parsing your order ({model_type})..."))
+            self.root.after(0, self.start_ai_parse, model_type)
             
             # === STAGE 1: Format the raw text into simple character-name format ===
-            self.root.after(0, lambda: self.log(f"STAGE 1: Formatting raw order text...", "info"))
             formatted_text = self.format_with_ai_stage1(raw_text, use_reasoning)
             
             if not formatted_text:
-                self.root.after(0, lambda: messagebox.showerror("AI Error", "Stage 1: Failed to format orders. Check the log for details."))
-                self.root.after(0, lambda: self.log("Stage 1 formatting failed", "error"))
+                self.root.after(0, self.report_ai_failure, "AI Error",
+                                "Stage 1: Failed to format orders. Check the log for details.",
+                                "Stage 1 formatting failed")
                 return
             
-            self.root.after(0, lambda: self.log(f"STAGE 1 Complete: Formatted text ready", "success"))
-            self.root.after(0, lambda ft=formatted_text: self.log(f"Formatted output:\n{ft}", "info"))
-            
-            # Update the AI input field with Stage 1 formatted text
-            self.root.after(0, lambda: self.raw_text.delete(1.0, tk.END))
-            self.root.after(0, lambda ft=formatted_text: self.raw_text.insert(1.0, ft))
-            self.root.after(0, lambda: self.raw_text.config(fg="black"))
+            self.root.after(0, self.apply_stage1_text, formatted_text, len(self.image_list))
             
             # === STAGE 2: Parse the formatted text to match images ===
-            self.root.after(0, lambda: self.log(f"STAGE 2: Matching to images with {len(self.image_list)} available images...", "info"))
             result = self.call_grok_api(self.image_list, formatted_text, use_reasoning)
             
             if not result:
-                self.root.after(0, lambda: messagebox.showerror("AI Error", "Stage 2: Failed to match images. Check the log for details."))
-                self.root.after(0, lambda: self.log("Stage 2 image matching failed", "error"))
+                self.root.after(0, self.report_ai_failure, "AI Error",
+                                "Stage 2: Failed to match images. Check the log for details.",
+                                "Stage 2 image matching failed")
                 return
             
-            self.root.after(0, lambda: self.log(f"STAGE 2 Complete: Matched images", "success"))
-            
             # Convert result to simple format - PRESERVE UNMATCHED ITEMS
             orders = []
             unmatched_count = 0
+            unknown_images = []  # Filenames the AI returned that aren't in the image folders
             
             # Handle both old dictionary format and new list format
             if isinstance(result, list):
@@ -2177,198 +2722,153 @@ OUTPUT FORMAT: Return ONLY the formatted lines, one per line, no explanations, n
                         name = item['name']
                         image_file = item['image']
                         original_item = item.get('item', '')  # Get original item description if available
+                        listed_file = self.find_listed_image(image_file)
                         
                         # Check for N/A or unmatched items
                         if image_file.lower() in ['n/a', 'n/a.png', 'unknown', 'unknown.png', 'not_found', 'not_found.png']:
                             # Include original item info for unmatched items
                             if original_item:
-                                orders.append(f"IMAGE-NOT-FOUND [{original_item}],{name}")
+                                orders.append(_format_order_line(f"IMAGE-NOT-FOUND [{original_item}]", name))
                             else:
-                                orders.append(f"IMAGE-NOT-FOUND,{name}")
+                                orders.append(_format_order_line("IMAGE-NOT-FOUND", name))
+                            unmatched_count += 1
+                        elif listed_file is None:
+                            # Not a real file - let the user pick in the preview instead
+                            unknown_images.append(image_file)
+                            orders.append(_format_order_line(f"IMAGE-NOT-FOUND [{original_item or image_file}]", name))
                             unmatched_count += 1
                         else:
-                            # Remove .png extension
-                            character = image_file.replace('.png', '')
-                            orders.append(f"{character},{name}")
+                            # Remove .png extension (using the folder's spelling of the name)
+                            character = listed_file.replace('.png', '')
+                            orders.append(_format_order_line(character, name))
             elif isinstance(result, dict):
                 # Old dictionary format - kept for backwards compatibility
                 for name, image_file in result.items():
                     if name not in ['_order', 'unmatched']:
+                        listed_file = self.find_listed_image(image_file) if image_file else None
                         if not image_file or image_file.lower() in ['n/a', 'unknown', 'not_found']:
-                            orders.append(f"IMAGE-NOT-FOUND,{name}")
+                            orders.append(_format_order_line("IMAGE-NOT-FOUND", name))
+                            unmatched_count += 1
+                        elif listed_file is None:
+                            unknown_images.append(image_file)
+                            orders.append(_format_order_line(f"IMAGE-NOT-FOUND [{image_file}]", name))
                             unmatched_count += 1
                         else:
-                            # Remove .png extension
-                            character = image_file.replace('.png', '')
-                            orders.append(f"{character},{name}")
+                            # Remove .png extension (using the folder's spelling of the name)
+                            character = listed_file.replace('.png', '')
+                            orders.append(_format_order_line(character, name))
+            
+            if unknown_images:
+                self.root.after(0, lambda imgs=', '.join(unknown_images): self.log(f"AI returned images that don't exist: {imgs}", "warning"))
             
             if not orders:
-                self.root.after(0, lambda: messagebox.showwarning("No Matches", "AI couldn't find any matching orders.\nTry being more specific or use manual entry."))
-                self.root.after(0, lambda: self.log("No orders matched by AI", "warning"))
+                self.root.after(0, self.report_ai_failure, "No Matches",
+                                "AI couldn't find any matching orders.\nTry being more specific or use manual entry.",
+                                "No orders matched by AI", "warning")
                 return
             
-            # Fill input area
-            orders_text = '\n'.join(orders)
-            self.root.after(0, lambda: self.order_input.delete(1.0, tk.END))
-            self.root.after(0, lambda: self.order_input.insert(1.0, orders_text))
-            self.root.after(0, lambda: self.order_input.config(fg="black"))
-            self.root.after(0, lambda: self.update_count())
-            self.root.after(0, lambda: self.preview_orders())
-            
-            # Show appropriate message based on matches
-            if unmatched_count > 0:
-                self.root.after(0, lambda: self.log(f"✓ 2-Stage AI Complete: {len(orders)} orders ({unmatched_count} need image selection)", "warning"))
-                self.root.after(0, lambda: self.status_text.set(f"✓ AI found {len(orders)} orders - {unmatched_count} need image selection"))
-                self.root.after(0, lambda um=unmatched_count, tot=len(orders): messagebox.showwarning(
-                    "Partial Match",
-                    f"2-Stage AI Processing Complete!\n\n"
-                    f"✓ Stage 1: Formatted {tot} orders\n"
-                    f"✓ Stage 2: Matched images\n\n"
-                    f"⚠️ {um} item{'s' if um != 1 else ''} couldn't be matched to images.\n"
-                    f"They are marked as 'IMAGE-NOT-FOUND'.\n\n"
-                    f"In the preview window, you can search and select\n"
-                    f"the correct images for these items.\n\n"
-                    f"Click 'Preview Orders' to review and fix."
-                ))
-            else:
-                self.root.after(0, lambda: self.log(f"✓ 2-Stage AI Complete: {len(orders)} orders successfully parsed!", "success"))
-                self.root.after(0, lambda: self.status_text.set(f"✓ AI found {len(orders)} orders! Review and click Process."))
-                self.root.after(0, lambda tot=len(orders): messagebox.showinfo("Success!", f"2-Stage AI Processing Complete!\n\n✓ Stage 1: Formatted {tot} orders\n✓ Stage 2: All images matched\n\nReview and click 'Process Orders' when ready."))
+            self.root.after(0, self.apply_ai_orders, orders, unmatched_count)
             
         except Exception as e:
             error_msg = str(e)
-            self.root.after(0, lambda msg=error_msg: self.log(f"2-Stage AI Error: {msg}", "error"))
-            self.root.after(0, lambda msg=error_msg: messagebox.showerror("Error", f"2-Stage AI parsing failed:\n{msg}"))
+            self.root.after(0, self.report_ai_failure, "Error", f"2-Stage AI parsing failed:\n{error_msg}",
+                            f"2-Stage AI Error: {error_msg}")
             
         finally:
-            self.ai_processing = False
-            # Re-enable both AI buttons
-            self.root.after(0, lambda: self.ai_parse_btn.config(state=tk.NORMAL, text="✨ Parse with AI (Grok)"))
-            self.root.after(0, lambda: self.quick_parse_btn.config(state=tk.NORMAL, text="⚡ Quick Parse"))
+            self.root.after(0, self.finish_ai_parse)
+    
+    # UI-thread halves of the AI parse: each is scheduled with a single after() call
+    
+    def start_ai_parse(self, model_type):
+        """Disable both AI buttons and announce the parse"""
+        self.ai_parse_btn.config(state=tk.DISABLED, text="🤖 Processing...")
+        self.quick_parse_btn.config(state=tk.DISABLED, text="⚡ Processing...")
+        self.status_text.set(f"AI is parsing your order ({model_type})...")
+        self.log("STAGE 1: Formatting raw order text...", "info")
+    
+    def apply_stage1_text(self, formatted_text, image_count):
+        """Show the Stage 1 output in the AI input field"""
+        self.log("STAGE 1 Complete: Formatted text ready", "success")
+        self.log(f"Formatted output:\n{formatted_text}", "info")
+        self.raw_text.delete(1.0, tk.END)
+        self.raw_text.insert(1.0, formatted_text)
+        self.raw_text.config(fg="black")
+        self.log(f"STAGE 2: Matching to images with {image_count} available images...", "info")
+    
+    def apply_ai_orders(self, orders, unmatched_count):
+        """Fill the order input with the AI's matches, preview them and report"""
+        self.log("STAGE 2 Complete: Matched images", "success")
+        
+        # Fill input area
+        self.order_input.delete(1.0, tk.END)
+        self.order_input.insert(1.0, '\n'.join(orders))
+        self.set_order_placeholder(False)
+        self.update_count()
+        self.preview_orders()
+        
+        # Show appropriate message based on matches
+        tot = len(orders)
+        if unmatched_count > 0:
+            um = unmatched_count
+            self.log(f"✓ 2-Stage AI Complete: {tot} orders ({um} need image selection)", "warning")
+            self.status_text.set(f"✓ AI found {tot} orders - {um} need image selection")
+            messagebox.showwarning(
+                "Partial Match",
+                f"2-Stage AI Processing Complete!\n\n"
+                f"✓ Stage 1: Formatted {tot} orders\n"
+                f"✓ Stage 2: Matched images\n\n"
+                f"⚠️ {um} item{'s' if um != 1 else ''} couldn't be matched to images.\n"
+                f"They are marked as 'IMAGE-NOT-FOUND'.\n\n"
+                f"In the preview window, you can search and select\n"
+                f"the correct images for these items.\n\n"
+                f"Click 'Preview Orders' to review and fix."
+            )
+        else:
+            self.log(f"✓ 2-Stage AI Complete: {tot} orders successfully parsed!", "success")
+            self.status_text.set(f"✓ AI found {tot} orders! Review and click Process.")
+            messagebox.showinfo("Success!", f"2-Stage AI Processing Complete!\n\n✓ Stage 1: Formatted {tot} orders\n✓ Stage 2: All images matched\n\nReview and click 'Process Orders' when ready.")
+    
+    def report_ai_failure(self, title, message, log_message, level="error"):
+        """Log an AI parse failure and tell the user"""
+        self.log(log_message, level)
+        if level == "warning":
+            messagebox.showwarning(title, message)
+        else:
+            messagebox.showerror(title, message)
+    
+    def finish_ai_parse(self):
+        """Re-enable both AI buttons once a parse has ended either way"""
+        self.ai_processing = False
+        self.ai_parse_btn.config(state=tk.NORMAL, text="✨ Parse with AI (Grok)")
+        self.quick_parse_btn.config(state=tk.NORMAL, text="⚡ Quick Parse")
             
     def call_grok_api(self, image_list, order_text, use_reasoning=True):
         """STAGE 2: Call Grok API to match formatted orders to images"""
         # Format the complete list of available images
         # Send ALL images so AI can choose from exact matches
-        images_formatted = '\n'.join(f"  - {img}" for img in image_list)
+        images_formatted = _format_image_list(image_list)
         
         # Choose model based on use_reasoning
         model = "grok-4-1-fast-reasoning" if use_reasoning else "grok-4-1-fast-non-reasoning"
         
-        prompt = f"""You are matching Disney character descriptions to exact image filenames.
-
-You will receive pre-formatted order text in this format:
-"Character description - name: PersonName"
-
-Your job is to match each character description to an EXACT image filename from the available list.
-
-COMPLETE LIST OF AVAILABLE IMAGES ({len(image_list)} total):
-{images_formatted}
-
-Pre-formatted order text:
-{order_text}
-
-MATCHING RULES:
-1. For each line, extract the character description and the name
-2. Match the character description to an EXACT filename from the list above
-3. You MUST use filenames EXACTLY as shown (including .png extension)
-4. **CRITICAL: If you cannot find a match, use "N/A.png" - DO NOT skip the item!**
-4.5 if there is a request for a captain, but there is only a normal image, use the normal image.
-5. Common patterns to match:
-   - "Mickey captain" → "mickey-captain.png"
-   - "Stitch captain" → "stitch-captain.png"
-   - "Elsa christmas" → "elsa-christmas.png"
-   - "Minnie Spiderman" → "minnie-spiderman.png"
-   - "Minnie pirate" → "minnie-pirate.png"
-   - "Donald Hulk" → "donald-hulk.png"
-   - "dog 16" → "dog-16.png"
-   - "duck 23" → "duck-23.png"
-6. Character names are case-insensitive for matching
-7. ALWAYS include ALL items, even if no match found (use "N/A.png")
-8. for magnets with no name, leave it blank. (example "name": "")
-
-=== BOAT IMAGE MATCHING ===
-Boat orders appear as "boat ShipName - name: FamilyName"
-Match boat orders to these EXACT filenames:
-- "boat Fantasy" → "boat_fantasy.png"
-- "boat Magic" → "boat_magic.png"
-- "boat Wonder" → "boat_wonder.png"
-- "boat Wish" → "boat_wish.png"
-- "boat Dream" → "boat_dream.png"
-- "boat Treasure" → "boat_treasure.png"
-- "boat Destiny" → "boat_destiny.png"
-- If ship name is unclear, default to "boat_fantasy.png"
-
-OUTPUT FORMAT - Return ONLY a Python LIST of dictionaries, no other text:
-[
-  {{"name": "PersonName1", "image": "exact-filename.png", "item": "original character description"}},
-  {{"name": "PersonName2", "image": "exact-filename.png", "item": "original character description"}},
-  {{"name": "", "image": "N/A.png", "item": "original character description"}}
-]
-
-EXAMPLES:
-
-Input: "Mickey captain - name: Johnny"
-Output: [{{"name": "Johnny", "image": "mickey-captain.png", "item": "Mickey captain"}}]
-
-Input: "Stitch pirate - name: Michael\\nMinnie Spiderman - name: Cecile"
-Output: [
-  {{"name": "Michael", "image": "stitch-pirate.png", "item": "Stitch pirate"}},
-  {{"name": "Cecile", "image": "minnie-spiderman.png", "item": "Minnie Spiderman"}}
-]
-
-Input: "boat Fantasy - name: The Smith Family"
-Output: [{{"name": "The Smith Family", "image": "boat_fantasy.png", "item": "boat Fantasy"}}]
-
-Input: "Mickey captain - name: Johnny\\nboat Magic - name: Johnson Crew\\nMinnie captain - name: Sarah"
-Output: [
-  {{"name": "Johnny", "image": "mickey-captain.png", "item": "Mickey captain"}},
-  {{"name": "Johnson Crew", "image": "boat_magic.png", "item": "boat Magic"}},
-  {{"name": "Sarah", "image": "minnie-captain.png", "item": "Minnie captain"}}
-]
-
-Input: "RareCharacter - name: Test"
-Output: [{{"name": "Test", "image": "N/A.png", "item": "RareCharacter"}}]
-
-CRITICAL: 
-- Only use filenames that EXACTLY match the list above
-- If no match found, use "N/A.png" - DO NOT OMIT THE ITEM
-- Return a LIST, preserving order
-- Include ALL items from the input
-- Boat orders use boat_*.png files, magnet orders use character-*.png files
-
-Return the list now:"""
+        prompt = STAGE2_PROMPT.format(count=len(image_list), images=images_formatted, order_text=order_text)
         
-        headers = {
-            "Authorization": f"Bearer {GROK_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        data = {
-            "model": model,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.1,
-            "max_tokens": 2000  # Sufficient for list output format
-        }
+        max_tokens = grok_token_budget(order_text)
+        data = {**GROK_BASE_DATA, "model": model, "max_tokens": max_tokens,
+                "messages": [{"role": "user", "content": prompt}]}
         
         try:
-            self.root.after(0, lambda: self.log("Sending request to Grok AI with complete image list...", "info"))
-            response = requests.post(GROK_API_URL, headers=headers, json=data, timeout=60)  # Increased timeout for larger prompt
-            response.raise_for_status()
-            
-            result = response.json()
-            content = result['choices'][0]['message']['content']
+            self.root.after(0, lambda: self.log(f"Sending request to Grok AI with complete image list (max {max_tokens} tokens)...", "info"))
+            content = self.stream_grok_completion(data, "Stage 2", stop_after_json=True)
             
             self.root.after(0, lambda: self.log(f"Received response from AI", "info"))
             
             # Try to extract list format first (new format)
-            list_start = content.find('[')
-            list_end = content.rfind(']') + 1
+            list_str = _extract_json_value(content, '[')
             
-            if list_start != -1 and list_end != 0:
+            if list_str:
                 try:
-                    list_str = content[list_start:list_end]
-                    matches = json.loads(list_str)
+                    matches = _json_loads(list_str)
                     if isinstance(matches, list):
                         self.root.after(0, lambda: self.log(f"Parsed {len(matches)} orders from AI (list format)", "info"))
                         return matches
@@ -2376,15 +2876,15 @@ Return the list now:"""
                     pass
             
             # Fallback to dictionary format (old format)
-            dict_start = content.find('{')
-            dict_end = content.rfind('}') + 1
+            dict_str = _extract_json_value(content, '{')
             
-            if dict_start != -1 and dict_end != 0:
+            if dict_str:
                 try:
-                    dict_str = content[dict_start:dict_end]
-                    matches = json.loads(dict_str)
-                    self.root.after(0, lambda: self.log(f"Parsed {len(matches)} orders from AI (dict format)", "info"))
-                    return matches
+                    matches = _json_loads(dict_str)
+                    # An object with an 'image' key is the first item of a truncated list, not a name map
+                    if 'image' not in matches:
+                        self.root.after(0, lambda: self.log(f"Parsed {len(matches)} orders from AI (dict format)", "info"))
+                        return matches
                 except json.JSONDecodeError:
                     pass
             
@@ -2531,6 +3031,7 @@ def main():
     root.geometry(f'{width}x{height}+{x}+{y}')
     
     root.mainloop()
+    app.close_thumbnail_cache()
 
 
 if __name__ == "__main__":
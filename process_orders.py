@@ -5,14 +5,20 @@ No UI, server, or API required - just run and go!
 """
 
 import os
+import io
 import sys
 import csv
 import math
+import functools
+import itertools
 import shutil
-import time
+import contextlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
 from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject, NumberObject
 
 
 # ============================================================================
@@ -26,15 +32,21 @@ IMAGES_DIR = os.path.join(PARENT_DIR, 'FHM_Images')
 # Template PDF for output
 TEMPLATE_PDF = "format.pdf"
 
-# Output directories
+# Output directory
 OUTPUTS_DIR = "outputs"
-TEMP_DIR = "temp"
 
 # Font paths
 FONT_WALTOGRAPH = "font/waltographUI.ttf"
 FONT_BLUEBERRY = "font/blueberry.ttf"
 FONT_FALLBACK = "font/waltograph42.otf"
 
+# Parallel rendering - personalized images are rendered in worker processes
+MAX_WORKERS = None                 # Worker processes (None = one per CPU core, 1 = no pool)
+PARALLEL_MIN_JOBS = 8              # Smaller runs stay in-process (spawned workers re-import the app first)
+
+# Personalized PNGs in outputs/
+PNG_COMPRESS_LEVEL = 1             # zlib level for personalized PNGs (1 = fastest, 9 = smallest)
+
 
 # ============================================================================
 # BOAT CONFIGURATION (EDIT THESE TO FINE-TUNE TEXT & PDF PLACEMENT)
@@ -70,6 +82,14 @@ BOAT_PDF_SCALE = 1.41              # Scale factor for image size
 # TEXT RENDERING FUNCTIONS (from add_names.py)
 # ============================================================================
 
+@functools.lru_cache(maxsize=64)
+def get_font(font_path, font_size):
+    """Load a TrueType font once per (path, size); raises OSError like ImageFont.truetype"""
+    return ImageFont.truetype(font_path, font_size)
+
+
+# Fonts come from get_font(), so the same (font, glyph, style) recurs across names and orders
+@functools.lru_cache(maxsize=1024)
 def _glyph_advance(font: ImageFont.FreeTypeFont, ch: str) -> float:
     """Width advance for a glyph, with a safe fallback."""
     try:
@@ -79,8 +99,9 @@ def _glyph_advance(font: ImageFont.FreeTypeFont, ch: str) -> float:
         return max(1, bbox[2] - bbox[0])
 
 
+@functools.lru_cache(maxsize=512)
 def _render_glyph_rgba(font, ch, fill, stroke_width=0, stroke_fill=None):
-    """Render a single glyph to a tight RGBA image (no clipping)."""
+    """Render a single glyph to a tight RGBA image (no clipping). Cached - callers must not modify it."""
     bbox = font.getbbox(ch, stroke_width=stroke_width)
     w, h = bbox[2] - bbox[0], bbox[3] - bbox[1]
     pad = max(2, stroke_width + 1)
@@ -116,11 +137,11 @@ def draw_text_on_arc(
     
     # Load font robustly
     try:
-        font = ImageFont.truetype(font_path, font_size)
+        font = get_font(font_path, font_size)
     except OSError:
         for fallback in [FONT_WALTOGRAPH, FONT_FALLBACK]:
             try:
-                font = ImageFont.truetype(fallback, font_size)
+                font = get_font(fallback, font_size)
                 break
             except OSError:
                 font = None
@@ -204,10 +225,10 @@ def draw_boat_text_on_arc(
     
     # Load font robustly
     try:
-        font = ImageFont.truetype(font_path, font_size)
+        font = get_font(font_path, font_size)
     except OSError:
         try:
-            font = ImageFont.truetype(FONT_FALLBACK, font_size)
+            font = get_font(FONT_FALLBACK, font_size)
         except OSError:
             font = ImageFont.load_default()
 
@@ -283,9 +304,6 @@ def create_personalized_image(name, image_path, output_path):
         print(f"  Creating image without text for {os.path.basename(image_path)}")
         shutil.copy2(image_path, output_path)
         
-        # Small delay to ensure file is copied
-        time.sleep(0.05)
-        
         # Verify copy
         if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
             raise RuntimeError(f"Failed to copy image: {output_path}")
@@ -320,14 +338,9 @@ def create_personalized_image(name, image_path, output_path):
         stroke_fill=(0, 0, 0, 255),
     )
     
-    # Save with proper file handling
-    output_img = img.convert("RGBA")
-    output_img.save(output_path)
-    output_img.close()  # Explicitly close
-    img.close()  # Close original image too
-    
-    # Small delay to ensure file is written
-    time.sleep(0.05)
+    # Save with proper file handling (img is already RGBA; fast zlib since the PDF step re-encodes anyway)
+    img.save(output_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+    img.close()  # Explicitly close
     
     # Verify file was created and has content
     if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
@@ -356,9 +369,6 @@ def create_personalized_boat_image(name, image_path, output_path):
         print(f"  Creating boat image without text for {os.path.basename(image_path)}")
         shutil.copy2(image_path, output_path)
         
-        # Small delay to ensure file is copied
-        time.sleep(0.05)
-        
         # Verify copy
         if not os.path.exists(output_path) or os.path.getsize(output_path) == 0:
             raise RuntimeError(f"Failed to copy boat image: {output_path}")
@@ -395,14 +405,9 @@ def create_personalized_boat_image(name, image_path, output_path):
         stroke_fill=(255, 255, 255, 255),
     )
     
-    # Save with proper file handling
-    output_img = img.convert("RGBA")
-    output_img.save(output_path)
-    output_img.close()  # Explicitly close
-    img.close()  # Close original image too
-    
-    # Small delay to ensure file is written
-    time.sleep(0.05)
+    # Save with proper file handling (img is already RGBA; fast zlib since the PDF step re-encodes anyway)
+    img.save(output_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+    img.close()  # Explicitly close
     
     # Verify file was created and has content
     if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
@@ -418,11 +423,75 @@ def create_personalized_boat_image(name, image_path, output_path):
 # PDF GENERATION FUNCTIONS (from pdf.py)
 # ============================================================================
 
-def png_to_pdf(png_path, pdf_path):
-    """Convert PNG to PDF - simple and fast like original working version."""
+@functools.lru_cache(maxsize=4)
+def _template_bytes(pdf_path, mtime_ns):
+    """Raw template PDF contents, read once per file version"""
+    with open(pdf_path, "rb") as f:
+        return f.read()
+
+
+def open_template(pdf_path):
+    """
+    Open a template PDF without re-reading it from disk each time.
+    Returns a fresh reader on every call because merge_page() modifies the
+    template page in place.
+    """
+    data = _template_bytes(pdf_path, os.stat(pdf_path).st_mtime_ns)
+    return PdfReader(io.BytesIO(data))
+
+
+def _flate_image(img, color_space):
+    """Image XObject stream for an 8-bit RGB or L image, zlib-compressed (lossless)."""
+    raw = DecodedStreamObject()
+    raw.set_data(img.tobytes())
+    stream = raw.flate_encode()
+    stream.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(img.width),
+        NameObject("/Height"): NumberObject(img.height),
+        NameObject("/ColorSpace"): NameObject(color_space),
+        NameObject("/BitsPerComponent"): NumberObject(8),
+    })
+    return stream
+
+
+def png_to_pdf(png_path):
+    """
+    Convert PNG to a one-page in-memory PDF at 100 dpi (same page size as Image.save(..., "PDF")).
+    Pixels are stored losslessly with Flate and transparency as a soft mask;
+    Pillow's own PDF writer encodes RGBA as JPEG 2000, which is far slower.
+    
+    Returns:
+        BytesIO positioned at the start, ready for PdfReader
+    """
     try:
-        img = Image.open(png_path)
-        img.save(pdf_path, "PDF", resolution=100.0)
+        with Image.open(png_path) as img:
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA")
+            
+            writer = PdfWriter()
+            page_width = img.width * 72 / 100.0
+            page_height = img.height * 72 / 100.0
+            writer.add_blank_page(width=page_width, height=page_height)
+            page = writer.pages[0]  # add_blank_page() returns the page before the writer copies it
+            
+            # Streams must be indirect objects; PyPDF2 3.0 only exposes that as _add_object (pinned in requirements.txt)
+            image = _flate_image(img.convert("RGB"), "/DeviceRGB")
+            if img.mode == "RGBA":
+                image[NameObject("/SMask")] = writer._add_object(_flate_image(img.getchannel("A"), "/DeviceGray"))
+            
+            page[NameObject("/Resources")] = DictionaryObject({
+                NameObject("/XObject"): DictionaryObject({NameObject("/Im0"): writer._add_object(image)})
+            })
+            content = DecodedStreamObject()
+            content.set_data(f"q {page_width} 0 0 {page_height} 0 0 cm /Im0 Do Q".encode())
+            page[NameObject("/Contents")] = writer._add_object(content)
+            
+            pdf_data = io.BytesIO()
+            writer.write(pdf_data)
+            pdf_data.seek(0)
+            return pdf_data
     except Exception as e:
         print(f"Error converting {png_path} to PDF: {e}")
         raise
@@ -458,34 +527,19 @@ def create_pdf_with_images(input_pdf, image1, image2, output_pdf):
     except Exception as e:
         raise ValueError(f"Invalid image file(s): {e}")
     
-    # Convert images to temporary PDFs
-    os.makedirs(TEMP_DIR, exist_ok=True)
-    temp_pdf1 = os.path.join(TEMP_DIR, "temp_1.pdf")
-    temp_pdf2 = os.path.join(TEMP_DIR, "temp_2.pdf")
-    
-    # Clean up any existing temp files first
-    for temp_file in [temp_pdf1, temp_pdf2]:
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
-    
-    png_to_pdf(image1, temp_pdf1)
-    png_to_pdf(image2, temp_pdf2)
-    
-    # Verify temp PDFs were created successfully
-    if not os.path.exists(temp_pdf1) or os.path.getsize(temp_pdf1) == 0:
-        raise RuntimeError(f"Failed to create valid temp PDF for image 1: {image1}")
-    if not os.path.exists(temp_pdf2) or os.path.getsize(temp_pdf2) == 0:
-        raise RuntimeError(f"Failed to create valid temp PDF for image 2: {image2}")
-    print(f"  ✓ Temp PDFs created successfully")
+    # Convert images to in-memory PDFs
+    image_pdf1 = png_to_pdf(image1)
+    image_pdf2 = png_to_pdf(image2)
+    print(f"  ✓ Image PDFs created successfully")
     
     # Read the existing PDF
-    reader = PdfReader(input_pdf)
+    reader = open_template(input_pdf)
     num_pages = len(reader.pages)
     target = num_pages // 2
     
     # Read the image PDFs
-    reader_img1 = PdfReader(temp_pdf1)
-    reader_img2 = PdfReader(temp_pdf2)
+    reader_img1 = PdfReader(image_pdf1)
+    reader_img2 = PdfReader(image_pdf2)
     
     img_page1 = reader_img1.pages[0]
     img_page2 = reader_img2.pages[0]
@@ -545,14 +599,6 @@ def create_pdf_with_images(input_pdf, image1, image2, output_pdf):
     except Exception as e:
         raise RuntimeError(f"Output PDF validation failed: {output_pdf} - {e}")
     
-    # Clean up temporary files
-    try:
-        os.remove(temp_pdf1)
-        os.remove(temp_pdf2)
-        print(f"  ✓ Temporary files cleaned up")
-    except Exception as e:
-        print(f"  Warning: Could not clean up temp files: {e}")
-    
     return output_pdf
 
 
@@ -581,28 +627,17 @@ def create_boat_pdf(input_pdf, boat_image, output_pdf):
     except Exception as e:
         raise ValueError(f"Invalid boat image file: {e}")
     
-    # Convert image to temporary PDF
-    os.makedirs(TEMP_DIR, exist_ok=True)
-    temp_pdf = os.path.join(TEMP_DIR, "temp_boat.pdf")
-    
-    # Clean up any existing temp file first
-    if os.path.exists(temp_pdf):
-        os.remove(temp_pdf)
-    
-    png_to_pdf(boat_image, temp_pdf)
-    
-    # Verify temp PDF was created successfully
-    if not os.path.exists(temp_pdf) or os.path.getsize(temp_pdf) == 0:
-        raise RuntimeError(f"Failed to create valid temp PDF for boat image: {boat_image}")
-    print(f"  ✓ Temp boat PDF created successfully")
+    # Convert image to an in-memory PDF
+    image_pdf = png_to_pdf(boat_image)
+    print(f"  ✓ Boat image PDF created successfully")
     
     # Read the existing PDF template
-    reader = PdfReader(input_pdf)
+    reader = open_template(input_pdf)
     num_pages = len(reader.pages)
     target = num_pages // 2
     
     # Read the image PDF
-    reader_img = PdfReader(temp_pdf)
+    reader_img = PdfReader(image_pdf)
     img_page = reader_img.pages[0]
     
     # Use configurable positioning from constants
@@ -645,13 +680,6 @@ def create_boat_pdf(input_pdf, boat_image, output_pdf):
     except Exception as e:
         raise RuntimeError(f"Boat output PDF validation failed: {output_pdf} - {e}")
     
-    # Clean up temporary files
-    try:
-        os.remove(temp_pdf)
-        print(f"  ✓ Temporary boat files cleaned up")
-    except Exception as e:
-        print(f"  Warning: Could not clean up temp boat files: {e}")
-    
     return output_pdf
 
 
@@ -669,40 +697,38 @@ def read_csv_orders(csv_path):
     
     Returns list of (character, name) tuples in order.
     """
-    orders = []
-    
     with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
+        rows = csv.reader(f)
         
-        # Skip header if it exists (detect common header patterns)
-        first_row = next(reader, None)
-        if first_row:
-            # If first row looks like a header, skip it
-            if first_row[0].lower() in ['character', 'characters', 'image', 'file', 'name']:
-                pass  # Skip header
-            else:
-                # First row is data, process it
-                if len(first_row) >= 2:
-                    character = first_row[0].strip()
-                    name = first_row[1].strip() if len(first_row) > 1 else ""
-                    orders.append((character, name))
-                elif len(first_row) == 1:
-                    # Only character, no name
-                    character = first_row[0].strip()
-                    orders.append((character, ""))
+        # Skip header if it exists (detect common header patterns); otherwise the first row is data
+        first_row = next(rows, None)
+        if first_row and first_row[0].strip().lower() not in ['character', 'characters', 'image', 'file', 'name']:
+            rows = itertools.chain([first_row], rows)
         
-        # Process remaining rows
-        for row in reader:
-            if not row or not row[0].strip():
-                continue  # Skip empty rows
-            
-            character = row[0].strip()
-            name = row[1].strip() if len(row) > 1 else ""
-            orders.append((character, name))
+        # One pass over the data rows; empty rows are skipped and a missing name means no text
+        orders = [(row[0].strip(), row[1].strip() if len(row) > 1 else "")
+                  for row in rows if row and row[0].strip()]
     
     return orders
 
 
+# Lower-case filename -> real filename per folder, keyed by folder path -> (st_mtime_ns, index)
+_PNG_INDEX = {}
+
+def _png_index(folder):
+    """Case-insensitive index of a folder's .png files, re-read only when the folder changes"""
+    try:
+        mtime_ns = os.stat(folder).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _PNG_INDEX.get(folder)
+    if cached is None or cached[0] != mtime_ns:
+        with os.scandir(folder) as entries:
+            index = {e.name.lower(): e.name for e in entries if e.name.lower().endswith('.png')}
+        cached = _PNG_INDEX[folder] = (mtime_ns, index)
+    return cached[1]
+
+
 def find_image_file(character_name):
     """
     Find the image file for a character in the FHM_Images folder.
@@ -721,12 +747,8 @@ def find_image_file(character_name):
         return image_path
     
     # Try case-insensitive match
-    if os.path.exists(IMAGES_DIR):
-        for file in os.listdir(IMAGES_DIR):
-            if file.lower() == image_filename.lower():
-                return os.path.join(IMAGES_DIR, file)
-    
-    return None
+    file = _png_index(IMAGES_DIR).get(image_filename.lower())
+    return os.path.join(IMAGES_DIR, file) if file else None
 
 
 def find_boat_image_file(boat_name):
@@ -747,12 +769,8 @@ def find_boat_image_file(boat_name):
         return image_path
     
     # Try case-insensitive match
-    if os.path.exists(BOATS_DIR):
-        for file in os.listdir(BOATS_DIR):
-            if file.lower() == image_filename.lower():
-                return os.path.join(BOATS_DIR, file)
-    
-    return None
+    file = _png_index(BOATS_DIR).get(image_filename.lower())
+    return os.path.join(BOATS_DIR, file) if file else None
 
 
 def is_boat_order(character_name):
@@ -772,6 +790,18 @@ def process_all_orders(csv_path):
     4. Create PDFs (pairs for magnets, single for boats)
     """
     
+    # One worker pool shared by every stage of the run, started once the order count is known
+    pool = {'executor': None, 'workers': 1}
+    try:
+        return _process_all_orders(csv_path, pool)
+    finally:
+        if pool['executor'] is not None:
+            pool['executor'].shutdown()
+
+
+def _process_all_orders(csv_path, pool):
+    """Body of process_all_orders; pool is its shared worker-pool state"""
+    
     print("\n" + "="*70)
     print("DISNEY MAGNET & BOAT ORDER PROCESSOR")
     print("="*70)
@@ -822,6 +852,9 @@ def process_all_orders(csv_path):
         else:
             magnet_orders.append((char, name))
     
+    # Larger runs get a worker pool, reused by the image and PDF stages below
+    _start_render_pool(pool, len(orders))
+    
     print(f"✓ Found {len(orders)} total orders:")
     print(f"  • {len(magnet_orders)} magnet orders")
     print(f"  • {len(boat_orders)} boat orders")
@@ -856,32 +889,30 @@ def process_all_orders(csv_path):
     # Generate personalized MAGNET images
     print("\n[4/7] Generating personalized magnet images...")
     
-    generated_magnet_images = []
+    magnet_jobs = []
     magnet_img_counter = 1
     
     for i, (character, name) in enumerate(magnet_orders, 1):
-        print(f"\nProcessing magnet {i}/{len(magnet_orders)}: {character}")
+        header = f"\nProcessing magnet {i}/{len(magnet_orders)}: {character}"
         
         # Find source image
         source_image = find_image_file(character)
         if not source_image:
-            print(f"  ✗ ERROR: Image not found for character '{character}'")
-            print(f"     Looking for: {character}.png in {IMAGES_DIR}")
+            missing_msg = (f"  ✗ ERROR: Image not found for character '{character}'\n"
+                           f"     Looking for: {character}.png in {IMAGES_DIR}")
+            magnet_jobs.append((header, missing_msg, "magnet", name, None, None))
             continue
         
         # Generate output filename
         output_filename = f"magnet_{magnet_img_counter}.png"
         output_path = os.path.join(OUTPUTS_DIR, output_filename)
+        magnet_img_counter += 1
         
-        # Create personalized image
-        try:
-            create_personalized_image(name, source_image, output_path)
-            generated_magnet_images.append(output_path)
-            magnet_img_counter += 1
-        except Exception as e:
-            print(f"  ✗ ERROR creating magnet image: {e}")
-            import traceback
-            traceback.print_exc()
+        magnet_jobs.append((header, None, "magnet", name, source_image, output_path))
+    
+    # Create personalized images (in parallel for larger batches)
+    generated_magnet_images = _run_render_jobs(magnet_jobs, pool=pool)
+    generated_magnet_images = _renumber_outputs(generated_magnet_images, "magnet")  # Close gaps left by failed renders
     
     if magnet_orders and not generated_magnet_images:
         print("\n⚠ WARNING: No magnet images were generated successfully")
@@ -895,29 +926,28 @@ def process_all_orders(csv_path):
     boat_img_counter = 1
     
     if boat_orders:
+        boat_jobs = []
         for i, (boat_type, name) in enumerate(boat_orders, 1):
-            print(f"\nProcessing boat {i}/{len(boat_orders)}: {boat_type}")
+            header = f"\nProcessing boat {i}/{len(boat_orders)}: {boat_type}"
             
             # Find source boat image
             source_image = find_boat_image_file(boat_type)
             if not source_image:
-                print(f"  ✗ ERROR: Boat image not found for '{boat_type}'")
-                print(f"     Looking for: {boat_type}.png in {BOATS_DIR}")
+                missing_msg = (f"  ✗ ERROR: Boat image not found for '{boat_type}'\n"
+                               f"     Looking for: {boat_type}.png in {BOATS_DIR}")
+                boat_jobs.append((header, missing_msg, "boat", name, None, None))
                 continue
             
             # Generate output filename
             output_filename = f"boat_{boat_img_counter}.png"
             output_path = os.path.join(OUTPUTS_DIR, output_filename)
+            boat_img_counter += 1
             
-            # Create personalized boat image (opposite curve direction)
-            try:
-                create_personalized_boat_image(name, source_image, output_path)
-                generated_boat_images.append(output_path)
-                boat_img_counter += 1
-            except Exception as e:
-                print(f"  ✗ ERROR creating boat image: {e}")
-                import traceback
-                traceback.print_exc()
+            boat_jobs.append((header, None, "boat", name, source_image, output_path))
+        
+        # Create personalized boat images (opposite curve direction)
+        generated_boat_images = _run_render_jobs(boat_jobs, pool=pool)
+        generated_boat_images = _renumber_outputs(generated_boat_images, "boat")  # Close gaps left by failed renders
         
         if boat_orders and not generated_boat_images:
             print("\n⚠ WARNING: No boat images were generated successfully")
@@ -939,32 +969,26 @@ def process_all_orders(csv_path):
     
     if generated_magnet_images:
         # Process magnet images in pairs
-        for i in range(0, len(generated_magnet_images), 2):
-            if i + 1 < len(generated_magnet_images):
-                # We have a pair
-                image1 = generated_magnet_images[i]
-                image2 = generated_magnet_images[i + 1]
-                
-                pdf_num = (i // 2) + 1
-                output_pdf = f"order_output_{timestamp}_{pdf_num}.pdf"
-                
-                print(f"\nCreating magnet PDF {pdf_num}:")
-                print(f"  Top: {os.path.basename(image1)}")
-                print(f"  Bottom: {os.path.basename(image2)}")
-                
-                try:
-                    create_pdf_with_images(TEMPLATE_PDF, image1, image2, output_pdf)
-                    print(f"  ✓ Saved to {output_pdf}")
-                    magnet_pdf_count += 1
-                    
-                except Exception as e:
-                    print(f"  ✗ ERROR creating magnet PDF: {e}")
-                    import traceback
-                    traceback.print_exc()
-            else:
-                # Odd number of images - last one unpaired
-                print(f"\nNote: Magnet image {os.path.basename(generated_magnet_images[i])} has no pair")
-                print(f"      You can manually create a PDF using pdf.py if needed")
+        magnet_pdf_jobs = []
+        for i in range(0, len(generated_magnet_images) - 1, 2):
+            image1 = generated_magnet_images[i]
+            image2 = generated_magnet_images[i + 1]
+            
+            pdf_num = (i // 2) + 1
+            output_pdf = f"order_output_{timestamp}_{pdf_num}.pdf"
+            
+            header = (f"\nCreating magnet PDF {pdf_num}:\n"
+                      f"  Top: {os.path.basename(image1)}\n"
+                      f"  Bottom: {os.path.basename(image2)}")
+            magnet_pdf_jobs.append((header, "magnet", (image1, image2), output_pdf))
+        
+        # Build the PDFs (in parallel for larger batches)
+        magnet_pdf_count = len(_run_render_jobs(magnet_pdf_jobs, _pdf_job, pool))
+        
+        if len(generated_magnet_images) % 2:
+            # Odd number of images - last one unpaired
+            print(f"\nNote: Magnet image {os.path.basename(generated_magnet_images[-1])} has no pair")
+            print(f"      You can manually create a PDF using pdf.py if needed")
     else:
         print("  No magnet images to create PDFs from")
     
@@ -974,21 +998,15 @@ def process_all_orders(csv_path):
     boat_pdf_count = 0
     
     if generated_boat_images:
+        boat_pdf_jobs = []
         for i, boat_image in enumerate(generated_boat_images, 1):
             output_pdf = f"boat_output_{timestamp}_{i}.pdf"
             
-            print(f"\nCreating boat PDF {i}:")
-            print(f"  Image: {os.path.basename(boat_image)}")
-            
-            try:
-                create_boat_pdf(BOAT_TEMPLATE_PDF, boat_image, output_pdf)
-                print(f"  ✓ Saved to {output_pdf}")
-                boat_pdf_count += 1
-                
-            except Exception as e:
-                print(f"  ✗ ERROR creating boat PDF: {e}")
-                import traceback
-                traceback.print_exc()
+            header = (f"\nCreating boat PDF {i}:\n"
+                      f"  Image: {os.path.basename(boat_image)}")
+            boat_pdf_jobs.append((header, "boat", (boat_image,), output_pdf))
+        
+        boat_pdf_count = len(_run_render_jobs(boat_pdf_jobs, _pdf_job, pool))
     else:
         print("  No boat images to create PDFs from")
     
@@ -1016,6 +1034,149 @@ def process_all_orders(csv_path):
     return True
 
 
+# ============================================================================
+# PARALLEL RENDERING
+# ============================================================================
+
+def _init_render_worker():
+    """Pool initializer: load the magnet fonts once per worker before any jobs arrive"""
+    for font_path, font_size in [(FONT_WALTOGRAPH, 100), (FONT_BLUEBERRY, 90)]:
+        try:
+            get_font(font_path, font_size)
+        except OSError:
+            pass  # Reported (with fallback) when a job actually needs it
+
+
+def _render_job(job):
+    """
+    Render one personalized image. Runs in a worker process, so everything it
+    prints is captured and handed back to be printed by the parent in order.
+    
+    Returns:
+        (output_path or None on failure, captured output)
+    """
+    header, missing_msg, kind, name, source_image, output_path = job
+    result = None
+    captured = io.StringIO()
+    
+    with contextlib.redirect_stdout(captured):
+        print(header)
+        if source_image is None:
+            print(missing_msg)
+        else:
+            try:
+                if kind == "boat":
+                    create_personalized_boat_image(name, source_image, output_path)
+                else:
+                    create_personalized_image(name, source_image, output_path)
+                result = output_path
+            except Exception as e:
+                print(f"  ✗ ERROR creating {kind} image: {e}")
+                traceback.print_exc()
+    
+    return result, captured.getvalue()
+
+
+def _pdf_job(job):
+    """
+    Build one output PDF (a magnet pair or a single boat). Runs in a worker
+    process like _render_job, with its output captured the same way.
+    
+    Returns:
+        (output_pdf or None on failure, captured output)
+    """
+    header, kind, images, output_pdf = job
+    result = None
+    captured = io.StringIO()
+    
+    with contextlib.redirect_stdout(captured):
+        print(header)
+        try:
+            if kind == "boat":
+                create_boat_pdf(BOAT_TEMPLATE_PDF, images[0], output_pdf)
+            else:
+                create_pdf_with_images(TEMPLATE_PDF, images[0], images[1], output_pdf)
+            print(f"  ✓ Saved to {output_pdf}")
+            result = output_pdf
+        except Exception as e:
+            print(f"  ✗ ERROR creating {kind} PDF: {e}")
+            traceback.print_exc()
+    
+    return result, captured.getvalue()
+
+
+def _start_render_pool(pool, job_count):
+    """
+    Start the shared worker pool in pool['executor'] when there is enough work
+    for it. Leaves it as None (everything runs in-process) for small runs,
+    when MAX_WORKERS is 1, or when worker processes can't be created.
+    """
+    workers = min(MAX_WORKERS or os.cpu_count() or 1, job_count)
+    if workers < 2 or job_count < PARALLEL_MIN_JOBS:
+        return
+    try:
+        pool['executor'] = ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker)
+        pool['workers'] = workers
+    except Exception as e:
+        print(f"⚠ WARNING: Could not start worker processes ({e}), rendering one at a time")
+
+
+def _renumber_outputs(paths, prefix):
+    """
+    Rename rendered images to prefix_1.png, prefix_2.png, ... in order.
+    Numbers are handed out when jobs are queued, so a failed render would
+    otherwise leave a gap; this keeps the sequential names (and the PDF
+    pairing) the same as rendering one at a time.
+    
+    Returns:
+        The new paths, in the same order
+    """
+    numbered = []
+    for number, path in enumerate(paths, 1):
+        target = os.path.join(OUTPUTS_DIR, f"{prefix}_{number}.png")
+        if path != target:
+            os.replace(path, target)  # Targets only move down, onto failed or already-moved numbers
+            print(f"  Renumbered {os.path.basename(path)} → {os.path.basename(target)}")
+        numbered.append(target)
+    return numbered
+
+
+def _run_render_jobs(jobs, job_fn=_render_job, pool=None):
+    """
+    Run jobs (_render_job or _pdf_job tuples) on the shared worker pool
+    (in-process when there is none) and print each job's output in order.
+    Returns the paths of the files that were created.
+    """
+    generated = []
+    
+    def collect(result):
+        output_path, output = result
+        for line in output.splitlines():
+            print(line)
+        if output_path:
+            generated.append(output_path)
+    
+    done = 0
+    executor = pool['executor'] if pool else None
+    if executor is not None and jobs:
+        try:
+            # A few jobs per task hand-off, while still spreading the batch over every worker
+            chunksize = max(1, len(jobs) // (pool['workers'] * 4))
+            for result in executor.map(job_fn, jobs, chunksize=chunksize):
+                collect(result)
+                done += 1
+        except Exception as e:
+            # e.g. a worker crashed - drop the pool so later stages don't retry it, finish the rest here
+            print(f"⚠ WARNING: Parallel rendering stopped ({e}), continuing one at a time")
+            executor.shutdown(wait=False, cancel_futures=True)
+            pool['executor'] = None
+    
+    for job in jobs[done:]:
+        collect(job_fn(job))
+    
+    return generated
+
+
 # ============================================================================
 # COMMAND LINE INTERFACE
 # ============================================================================
@@ -0,0 +1,38 @@
+"""
+Round-trip check for process_orders.png_to_pdf: the in-memory PDF must read
+back through PdfReader with the original pixels and alpha intact.
+"""
+
+from PIL import Image
+from PyPDF2 import PdfReader
+
+import process_orders
+
+
+def test_png_to_pdf_round_trip(tmp_path):
+    png_path = tmp_path / "magnet.png"
+    Image.new("RGBA", (200, 100), (255, 0, 0, 128)).save(png_path)
+
+    reader = PdfReader(process_orders.png_to_pdf(str(png_path)))
+    assert len(reader.pages) == 1
+
+    page = reader.pages[0]
+    assert (float(page.mediabox.width), float(page.mediabox.height)) == (144.0, 72.0)  # 100 dpi
+
+    image = page["/Resources"]["/XObject"]["/Im0"].get_object()
+    assert (image["/Width"], image["/Height"], image["/ColorSpace"]) == (200, 100, "/DeviceRGB")
+    assert image.get_data() == bytes([255, 0, 0]) * (200 * 100)
+
+    smask = image["/SMask"].get_object()
+    assert smask["/ColorSpace"] == "/DeviceGray"
+    assert smask.get_data() == bytes([128]) * (200 * 100)
+
+
+def test_png_to_pdf_rgb_has_no_soft_mask(tmp_path):
+    png_path = tmp_path / "boat.png"
+    Image.new("RGB", (30, 20), (0, 0, 255)).save(png_path)
+
+    page = PdfReader(process_orders.png_to_pdf(str(png_path))).pages[0]
+    image = page["/Resources"]["/XObject"]["/Im0"].get_object()
+    assert "/SMask" not in image
+    assert image.get_data() == bytes([0, 0, 255]) * (30 * 20)